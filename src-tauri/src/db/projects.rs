@@ -1,6 +1,7 @@
-use std::collections::HashSet;
+use std::cell::RefCell;
+use std::collections::{HashMap, HashSet};
 use std::path::{Path, PathBuf};
-use std::sync::{LazyLock, Mutex};
+use std::sync::{Arc, LazyLock, Mutex};
 
 use chrono::Utc;
 use rusqlite::{params, Connection, OptionalExtension};
@@ -65,6 +66,32 @@ const ASSET_LINK_TYPE_REFERENCE_OF: &str = "reference_of";
 /// Tracks which database files have been initialized to avoid repeated schema checks.
 static INITIALIZED_DB_PATHS: LazyLock<Mutex<HashSet<String>>> = LazyLock::new(|| Mutex::new(HashSet::new()));
 
+/// Per-database-path write serialization.
+/// SQLite only ever admits a single writer; queueing write transactions
+/// behind one app-level lock per database file keeps concurrent callers
+/// waiting here instead of spinning against SQLITE_BUSY in the driver.
+static WRITE_LOCKS: LazyLock<Mutex<HashMap<String, Arc<Mutex<()>>>>> =
+    LazyLock::new(|| Mutex::new(HashMap::new()));
+
+fn write_lock_for(db_path: &Path) -> Result<Arc<Mutex<()>>, ProjectsRepoError> {
+    let mut locks = WRITE_LOCKS.lock().map_err(|e| {
+        ProjectsRepoError::Validation(format!("Lock poisoned: {e}"))
+    })?;
+    Ok(locks
+        .entry(db_path.to_string_lossy().to_string())
+        .or_default()
+        .clone())
+}
+
+thread_local! {
+    // One configured connection per (thread, database path). Opening and
+    // PRAGMA-configuring a connection per store call threw away the
+    // prepared-statement cache on every request; reusing the connection
+    // keeps hot statements compiled across calls on the same thread.
+    static THREAD_CONNECTIONS: RefCell<HashMap<String, Connection>> =
+        RefCell::new(HashMap::new());
+}
+
 #[derive(Debug, Clone, Serialize)]
 pub struct ProjectSummary {
     pub id: String,
@@ -246,9 +273,16 @@ impl ProjectsStore {
     }
 
     pub fn initialize(&self) -> Result<(), ProjectsRepoError> {
-        // Check if this database path has already been initialized
+        self.with_connection_no_schema(|conn| self.ensure_initialized(conn))
+    }
+
+    /// One-time schema check per database path. The in-process set makes
+    /// repeat calls free; for paths first touched by another process the
+    /// user_version fast path inside ensure_schema keeps the check to a
+    /// single PRAGMA read.
+    fn ensure_initialized(&self, conn: &Connection) -> Result<(), ProjectsRepoError> {
         let db_path_str = self.db_path.to_string_lossy().to_string();
-        
+
         {
             let initialized = INITIALIZED_DB_PATHS.lock().map_err(|e| {
                 ProjectsRepoError::Validation(format!("Lock poisoned: {e}"))
@@ -257,19 +291,14 @@ impl ProjectsStore {
                 return Ok(());
             }
         }
-        
-        // Run schema initialization for this database path
-        self.with_connection_no_schema(|conn| {
-            ensure_schema(conn)?;
-            
-            // Mark as initialized
-            let mut initialized = INITIALIZED_DB_PATHS.lock().map_err(|e| {
-                ProjectsRepoError::Validation(format!("Lock poisoned: {e}"))
-            })?;
-            initialized.insert(db_path_str.clone());
-            
-            Ok(())
-        })
+
+        ensure_schema(conn)?;
+
+        let mut initialized = INITIALIZED_DB_PATHS.lock().map_err(|e| {
+            ProjectsRepoError::Validation(format!("Lock poisoned: {e}"))
+        })?;
+        initialized.insert(db_path_str);
+        Ok(())
     }
 
     pub fn ensure_user(&self, username: &str, display_name: &str) -> Result<String, ProjectsRepoError> {
@@ -295,26 +324,54 @@ impl ProjectsStore {
     where
         F: FnOnce(&Connection) -> Result<T, ProjectsRepoError>,
     {
-        if let Some(parent) = self.db_path.parent() {
-            let _ = std::fs::create_dir_all(parent);
-        }
-        let conn = Connection::open(self.db_path.as_path())?;
-        configure_connection(&conn)?;
-        // Schema already initialized at startup via initialize()
-        func(&conn)
+        self.with_thread_connection(|conn| func(conn))
     }
 
     fn with_connection_mut<T, F>(&self, func: F) -> Result<T, ProjectsRepoError>
     where
         F: FnOnce(&mut Connection) -> Result<T, ProjectsRepoError>,
     {
-        if let Some(parent) = self.db_path.parent() {
-            let _ = std::fs::create_dir_all(parent);
-        }
-        let mut conn = Connection::open(self.db_path.as_path())?;
-        configure_connection(&conn)?;
-        // Schema already initialized at startup via initialize()
-        func(&mut conn)
+        // Serialize write transactions at the app layer so concurrent
+        // writers queue on this lock instead of racing for SQLite's
+        // single writer slot.
+        let write_lock = write_lock_for(self.db_path.as_path())?;
+        let _writer = write_lock.lock().map_err(|e| {
+            ProjectsRepoError::Validation(format!("Lock poisoned: {e}"))
+        })?;
+        self.with_thread_connection(func)
+    }
+
+    /// Runs `func` against this thread's cached connection for the store's
+    /// database path, opening and configuring one on first use. The
+    /// connection is checked out of the cache for the duration of the
+    /// call, so re-entrant store calls simply open a short-lived extra
+    /// connection instead of deadlocking on the cache.
+    fn with_thread_connection<T, F>(&self, func: F) -> Result<T, ProjectsRepoError>
+    where
+        F: FnOnce(&mut Connection) -> Result<T, ProjectsRepoError>,
+    {
+        let key = self.db_path.to_string_lossy().to_string();
+        let cached = THREAD_CONNECTIONS.with(|cell| cell.borrow_mut().remove(&key));
+        let mut conn = match cached {
+            Some(conn) => conn,
+            None => {
+                if let Some(parent) = self.db_path.parent() {
+                    let _ = std::fs::create_dir_all(parent);
+                }
+                let conn = Connection::open(self.db_path.as_path())?;
+                configure_connection(&conn)?;
+                conn
+            }
+        };
+        let result = self
+            .ensure_initialized(&conn)
+            .and_then(|()| func(&mut conn));
+        // Keep the outermost connection; a nested call that raced us back
+        // into the slot wins and this one just drops.
+        THREAD_CONNECTIONS.with(|cell| {
+            cell.borrow_mut().entry(key).or_insert(conn);
+        });
+        result
     }
 }
 
@@ -386,13 +443,24 @@ impl ProjectsStore {
             let safe_slug = normalize_slug(slug).ok_or(ProjectsRepoError::NotFound)?;
             let project = fetch_project_by_slug(conn, safe_slug.as_str())?.ok_or(ProjectsRepoError::NotFound)?;
 
-            let runs = query_count(conn, "SELECT COUNT(*) FROM runs WHERE project_id = ?1", [&project.id])?;
-            let jobs = query_count(
-                conn,
-                "SELECT COUNT(*) FROM run_jobs WHERE run_id IN (SELECT id FROM runs WHERE project_id = ?1)",
+            // One round trip for all three counts instead of three
+            // sequential prepare+step cycles.
+            let (runs, jobs, assets) = conn.query_row(
+                "
+                SELECT
+                  (SELECT COUNT(*) FROM runs WHERE project_id = ?1),
+                  (SELECT COUNT(*) FROM run_jobs WHERE run_id IN (SELECT id FROM runs WHERE project_id = ?1)),
+                  (SELECT COUNT(*) FROM assets WHERE project_id = ?1)
+                ",
                 [&project.id],
+                |row| {
+                    Ok((
+                        row.get::<_, i64>(0)?,
+                        row.get::<_, i64>(1)?,
+                        row.get::<_, i64>(2)?,
+                    ))
+                },
             )?;
-            let assets = query_count(conn, "SELECT COUNT(*) FROM assets WHERE project_id = ?1", [&project.id])?;
             let storage = resolve_storage(conn, self.repo_root.as_path(), &project)?;
 
             Ok(ProjectDetail {
@@ -490,6 +558,9 @@ impl ProjectsStore {
             let project = fetch_project_by_slug(conn, safe_slug.as_str())?
                 .ok_or(ProjectsRepoError::NotFound)?;
             ensure_project_storage_defaults(conn, &project)?;
+            // One timestamp per call keeps the touched columns consistent
+            // and avoids re-formatting the clock for every field update.
+            let now = now_iso();
 
             if let Some(raw_base_dir) = input.base_dir {
                 let base_dir_update = normalize_required_storage_field(raw_base_dir.as_str())
@@ -500,7 +571,7 @@ impl ProjectsStore {
                     SET local_base_dir = ?1, updated_at = ?2
                     WHERE project_id = ?3
                 ",
-                    params![base_dir_update, now_iso(), project.id],
+                    params![base_dir_update, now.as_str(), project.id],
                 )?;
             }
 
@@ -512,7 +583,7 @@ impl ProjectsStore {
                     SET local_project_root = ?1, updated_at = ?2
                     WHERE project_id = ?3
                 ",
-                    params![normalized_root, now_iso(), project.id],
+                    params![normalized_root, now.as_str(), project.id],
                 )?;
             }
 
@@ -530,6 +601,7 @@ impl ProjectsStore {
             let project = fetch_project_by_slug(conn, safe_slug.as_str())?
                 .ok_or(ProjectsRepoError::NotFound)?;
             ensure_project_storage_defaults(conn, &project)?;
+            let now = now_iso();
 
             if let Some(enabled) = input.enabled {
                 conn.execute(
@@ -538,7 +610,7 @@ impl ProjectsStore {
                     SET s3_enabled = ?1, updated_at = ?2
                     WHERE project_id = ?3
                 ",
-                    params![if enabled { 1 } else { 0 }, now_iso(), project.id],
+                    params![if enabled { 1 } else { 0 }, now.as_str(), project.id],
                 )?;
             }
 
@@ -551,7 +623,7 @@ impl ProjectsStore {
                 ",
                     params![
                         normalize_optional_storage_field(raw.as_str()),
-                        now_iso(),
+                        now.as_str(),
                         project.id
                     ],
                 )?;
@@ -566,7 +638,7 @@ impl ProjectsStore {
                 ",
                     params![
                         normalize_optional_storage_field(raw.as_str()),
-                        now_iso(),
+                        now.as_str(),
                         project.id
                     ],
                 )?;
@@ -581,7 +653,7 @@ impl ProjectsStore {
                 ",
                     params![
                         normalize_optional_storage_field(raw.as_str()),
-                        now_iso(),
+                        now.as_str(),
                         project.id
                     ],
                 )?;
@@ -596,7 +668,7 @@ impl ProjectsStore {
                 ",
                     params![
                         normalize_optional_storage_field(raw.as_str()),
-                        now_iso(),
+                        now.as_str(),
                         project.id
                     ],
                 )?;
@@ -611,7 +683,7 @@ impl ProjectsStore {
                 ",
                     params![
                         normalize_optional_storage_field(raw.as_str()),
-                        now_iso(),
+                        now.as_str(),
                         project.id
                     ],
                 )?;
@@ -878,7 +950,34 @@ struct StorageDefaults {
     s3_endpoint_url: String,
 }
 
+/// Bump whenever ensure_schema gains a table, column, or index so existing
+/// databases re-run the migration sweep exactly once.
+const SCHEMA_VERSION: i64 = 2;
+
 fn ensure_schema(conn: &Connection) -> Result<(), ProjectsRepoError> {
+    // Databases stamped with the current version have already been through
+    // the full sweep below; skip the table_info probes and ALTERs entirely.
+    let user_version: i64 = conn.query_row("PRAGMA user_version", [], |row| row.get(0))?;
+    if user_version == SCHEMA_VERSION {
+        return Ok(());
+    }
+    // Run the whole sweep — tables, backfill columns, indexes, ANALYZE —
+    // as one write transaction so init pays a single fsync pair instead
+    // of one per autocommitted statement.
+    conn.execute_batch("BEGIN IMMEDIATE")?;
+    match run_schema_sweep(conn) {
+        Ok(()) => {
+            conn.execute_batch("COMMIT")?;
+            Ok(())
+        }
+        Err(error) => {
+            let _ = conn.execute_batch("ROLLBACK");
+            Err(error)
+        }
+    }
+}
+
+fn run_schema_sweep(conn: &Connection) -> Result<(), ProjectsRepoError> {
     conn.execute_batch(
         "
         CREATE TABLE IF NOT EXISTS users (
@@ -1031,150 +1130,168 @@ fn ensure_schema(conn: &Connection) -> Result<(), ProjectsRepoError> {
     reference_sets::ensure_reference_set_tables(conn)?;
     secrets::ensure_secret_tables(conn)?;
 
-    ensure_column(conn, "projects", "owner_user_id", "TEXT")?;
-    ensure_column(
+    ensure_columns(
         conn,
-        "project_storage",
-        "local_base_dir",
-        "TEXT NOT NULL DEFAULT 'var/projects'",
+        "projects",
+        &[
+            ("owner_user_id", "TEXT"),
+        ],
     )?;
-    ensure_column(conn, "project_storage", "local_project_root", "TEXT")?;
-    ensure_column(
+    ensure_columns(
         conn,
         "project_storage",
-        "s3_enabled",
-        "INTEGER NOT NULL DEFAULT 0",
+        &[
+            ("local_base_dir", "TEXT NOT NULL DEFAULT 'var/projects'"),
+            ("local_project_root", "TEXT"),
+            ("s3_enabled", "INTEGER NOT NULL DEFAULT 0"),
+            ("s3_bucket", "TEXT"),
+            ("s3_prefix", "TEXT"),
+            ("s3_region", "TEXT"),
+            ("s3_profile", "TEXT"),
+            ("s3_endpoint_url", "TEXT"),
+        ],
     )?;
-    ensure_column(conn, "project_storage", "s3_bucket", "TEXT")?;
-    ensure_column(conn, "project_storage", "s3_prefix", "TEXT")?;
-    ensure_column(conn, "project_storage", "s3_region", "TEXT")?;
-    ensure_column(conn, "project_storage", "s3_profile", "TEXT")?;
-    ensure_column(conn, "project_storage", "s3_endpoint_url", "TEXT")?;
-    ensure_column(conn, "api_tokens", "user_id", "TEXT NOT NULL DEFAULT ''")?;
-    ensure_column(conn, "api_tokens", "project_id", "TEXT")?;
-    ensure_column(conn, "api_tokens", "token_hash", "TEXT NOT NULL DEFAULT ''")?;
-    ensure_column(
+    ensure_columns(
         conn,
         "api_tokens",
-        "token_prefix",
-        "TEXT NOT NULL DEFAULT ''",
+        &[
+            ("user_id", "TEXT NOT NULL DEFAULT ''"),
+            ("project_id", "TEXT"),
+            ("token_hash", "TEXT NOT NULL DEFAULT ''"),
+            ("token_prefix", "TEXT NOT NULL DEFAULT ''"),
+            ("label", "TEXT NOT NULL DEFAULT ''"),
+            ("expires_at", "TEXT"),
+            ("revoked_at", "TEXT"),
+            ("last_used_at", "TEXT"),
+            ("created_at", "TEXT NOT NULL DEFAULT ''"),
+        ],
     )?;
-    ensure_column(conn, "api_tokens", "label", "TEXT NOT NULL DEFAULT ''")?;
-    ensure_column(conn, "api_tokens", "expires_at", "TEXT")?;
-    ensure_column(conn, "api_tokens", "revoked_at", "TEXT")?;
-    ensure_column(conn, "api_tokens", "last_used_at", "TEXT")?;
-    ensure_column(conn, "api_tokens", "created_at", "TEXT NOT NULL DEFAULT ''")?;
-    ensure_column(conn, "audit_events", "project_id", "TEXT")?;
-    ensure_column(conn, "audit_events", "actor_user_id", "TEXT")?;
-    ensure_column(
+    ensure_columns(
         conn,
         "audit_events",
-        "event_code",
-        "TEXT NOT NULL DEFAULT ''",
+        &[
+            ("project_id", "TEXT"),
+            ("actor_user_id", "TEXT"),
+            ("event_code", "TEXT NOT NULL DEFAULT ''"),
+            ("payload_json", "TEXT NOT NULL DEFAULT '{}'"),
+            ("created_at", "TEXT NOT NULL DEFAULT ''"),
+        ],
     )?;
-    ensure_column(
+
+    ensure_columns(
         conn,
-        "audit_events",
-        "payload_json",
-        "TEXT NOT NULL DEFAULT '{}'",
+        "runs",
+        &[
+            ("run_log_path", "TEXT"),
+            ("run_mode", "TEXT"),
+            ("mode", "TEXT"),
+            ("stage", "TEXT"),
+            ("time_of_day", "TEXT"),
+            ("weather", "TEXT"),
+            ("model_name", "TEXT"),
+            ("model", "TEXT"),
+            ("provider_code", "TEXT"),
+            ("settings_snapshot_json", "TEXT"),
+            ("meta_json", "TEXT"),
+            ("started_at", "TEXT"),
+            ("finished_at", "TEXT"),
+            ("status", "TEXT"),
+            ("image_size", "TEXT"),
+            ("image_quality", "TEXT"),
+            ("created_at", "TEXT"),
+        ],
     )?;
-    ensure_column(
+
+    ensure_columns(
         conn,
-        "audit_events",
-        "created_at",
-        "TEXT NOT NULL DEFAULT ''",
+        "run_jobs",
+        &[
+            ("job_key", "TEXT"),
+            ("status", "TEXT"),
+            ("prompt_text", "TEXT"),
+            ("selected_candidate", "INTEGER"),
+            ("selected_candidate_index", "INTEGER"),
+            ("final_asset_id", "TEXT"),
+            ("final_output", "TEXT"),
+            ("meta_json", "TEXT"),
+            ("created_at", "TEXT"),
+        ],
     )?;
 
-    ensure_column(conn, "runs", "run_log_path", "TEXT")?;
-    ensure_column(conn, "runs", "run_mode", "TEXT")?;
-    ensure_column(conn, "runs", "mode", "TEXT")?;
-    ensure_column(conn, "runs", "stage", "TEXT")?;
-    ensure_column(conn, "runs", "time_of_day", "TEXT")?;
-    ensure_column(conn, "runs", "weather", "TEXT")?;
-    ensure_column(conn, "runs", "model_name", "TEXT")?;
-    ensure_column(conn, "runs", "model", "TEXT")?;
-    ensure_column(conn, "runs", "provider_code", "TEXT")?;
-    ensure_column(conn, "runs", "settings_snapshot_json", "TEXT")?;
-    ensure_column(conn, "runs", "meta_json", "TEXT")?;
-    ensure_column(conn, "runs", "started_at", "TEXT")?;
-    ensure_column(conn, "runs", "finished_at", "TEXT")?;
-    ensure_column(conn, "runs", "status", "TEXT")?;
-    ensure_column(conn, "runs", "image_size", "TEXT")?;
-    ensure_column(conn, "runs", "image_quality", "TEXT")?;
-    ensure_column(conn, "runs", "created_at", "TEXT")?;
-
-    ensure_column(conn, "run_jobs", "job_key", "TEXT")?;
-    ensure_column(conn, "run_jobs", "status", "TEXT")?;
-    ensure_column(conn, "run_jobs", "prompt_text", "TEXT")?;
-    ensure_column(conn, "run_jobs", "selected_candidate", "INTEGER")?;
-    ensure_column(conn, "run_jobs", "selected_candidate_index", "INTEGER")?;
-    ensure_column(conn, "run_jobs", "final_asset_id", "TEXT")?;
-    ensure_column(conn, "run_jobs", "final_output", "TEXT")?;
-    ensure_column(conn, "run_jobs", "meta_json", "TEXT")?;
-    ensure_column(conn, "run_jobs", "created_at", "TEXT")?;
-
-    ensure_column(conn, "run_job_candidates", "candidate_index", "INTEGER")?;
-    ensure_column(conn, "run_job_candidates", "status", "TEXT")?;
-    ensure_column(conn, "run_job_candidates", "output_path", "TEXT")?;
-    ensure_column(conn, "run_job_candidates", "final_output_path", "TEXT")?;
-    ensure_column(conn, "run_job_candidates", "rank_hard_failures", "INTEGER")?;
-    ensure_column(conn, "run_job_candidates", "rank_soft_warnings", "INTEGER")?;
-    ensure_column(conn, "run_job_candidates", "rank_avg_chroma_exceed", "REAL")?;
-    ensure_column(conn, "run_job_candidates", "meta_json", "TEXT")?;
-    ensure_column(conn, "run_job_candidates", "created_at", "TEXT")?;
-
-    ensure_column(conn, "run_candidates", "candidate_index", "INTEGER")?;
-    ensure_column(conn, "run_candidates", "status", "TEXT")?;
-    ensure_column(conn, "run_candidates", "output_asset_id", "TEXT")?;
-    ensure_column(conn, "run_candidates", "final_asset_id", "TEXT")?;
-    ensure_column(conn, "run_candidates", "output_path", "TEXT")?;
-    ensure_column(conn, "run_candidates", "final_output_path", "TEXT")?;
-    ensure_column(conn, "run_candidates", "rank_hard_failures", "INTEGER")?;
-    ensure_column(conn, "run_candidates", "rank_soft_warnings", "INTEGER")?;
-    ensure_column(conn, "run_candidates", "rank_avg_chroma_exceed", "REAL")?;
-    ensure_column(conn, "run_candidates", "meta_json", "TEXT")?;
-    ensure_column(conn, "run_candidates", "created_at", "TEXT")?;
-
-    ensure_column(conn, "assets", "kind", "TEXT")?;
-    ensure_column(conn, "assets", "asset_kind", "TEXT")?;
-    ensure_column(conn, "assets", "storage_uri", "TEXT")?;
-    ensure_column(conn, "assets", "rel_path", "TEXT")?;
-    ensure_column(conn, "assets", "storage_backend", "TEXT")?;
-    ensure_column(conn, "assets", "mime_type", "TEXT")?;
-    ensure_column(conn, "assets", "width", "INTEGER")?;
-    ensure_column(conn, "assets", "height", "INTEGER")?;
-    ensure_column(conn, "assets", "sha256", "TEXT")?;
-    ensure_column(conn, "assets", "run_id", "TEXT")?;
-    ensure_column(conn, "assets", "job_id", "TEXT")?;
-    ensure_column(conn, "assets", "candidate_id", "TEXT")?;
-    ensure_column(conn, "assets", "metadata_json", "TEXT")?;
-    ensure_column(conn, "assets", "meta_json", "TEXT")?;
-    ensure_column(conn, "assets", "created_at", "TEXT")?;
-
-    ensure_column(conn, "asset_links", "project_id", "TEXT NOT NULL")?;
-    ensure_column(conn, "asset_links", "parent_asset_id", "TEXT NOT NULL")?;
-    ensure_column(conn, "asset_links", "child_asset_id", "TEXT NOT NULL")?;
-    ensure_column(
+    ensure_columns(
         conn,
-        "asset_links",
-        "link_type",
-        "TEXT NOT NULL DEFAULT 'derived_from'",
+        "run_job_candidates",
+        &[
+            ("candidate_index", "INTEGER"),
+            ("status", "TEXT"),
+            ("output_path", "TEXT"),
+            ("final_output_path", "TEXT"),
+            ("rank_hard_failures", "INTEGER"),
+            ("rank_soft_warnings", "INTEGER"),
+            ("rank_avg_chroma_exceed", "REAL"),
+            ("meta_json", "TEXT"),
+            ("created_at", "TEXT"),
+        ],
     )?;
-    ensure_column(
+
+    ensure_columns(
         conn,
-        "asset_links",
-        "created_at",
-        "TEXT NOT NULL DEFAULT ''",
+        "run_candidates",
+        &[
+            ("candidate_index", "INTEGER"),
+            ("status", "TEXT"),
+            ("output_asset_id", "TEXT"),
+            ("final_asset_id", "TEXT"),
+            ("output_path", "TEXT"),
+            ("final_output_path", "TEXT"),
+            ("rank_hard_failures", "INTEGER"),
+            ("rank_soft_warnings", "INTEGER"),
+            ("rank_avg_chroma_exceed", "REAL"),
+            ("meta_json", "TEXT"),
+            ("created_at", "TEXT"),
+        ],
+    )?;
+
+    ensure_columns(
+        conn,
+        "assets",
+        &[
+            ("kind", "TEXT"),
+            ("asset_kind", "TEXT"),
+            ("storage_uri", "TEXT"),
+            ("rel_path", "TEXT"),
+            ("storage_backend", "TEXT"),
+            ("mime_type", "TEXT"),
+            ("width", "INTEGER"),
+            ("height", "INTEGER"),
+            ("sha256", "TEXT"),
+            ("run_id", "TEXT"),
+            ("job_id", "TEXT"),
+            ("candidate_id", "TEXT"),
+            ("metadata_json", "TEXT"),
+            ("meta_json", "TEXT"),
+            ("created_at", "TEXT"),
+        ],
     )?;
-    ensure_column(
+
+    ensure_columns(
         conn,
         "asset_links",
-        "updated_at",
-        "TEXT NOT NULL DEFAULT ''",
+        &[
+            ("project_id", "TEXT NOT NULL"),
+            ("parent_asset_id", "TEXT NOT NULL"),
+            ("child_asset_id", "TEXT NOT NULL"),
+            ("link_type", "TEXT NOT NULL DEFAULT 'derived_from'"),
+            ("created_at", "TEXT NOT NULL DEFAULT ''"),
+            ("updated_at", "TEXT NOT NULL DEFAULT ''"),
+        ],
     )?;
 
+    ensure_assets_storage_uri_unique(conn)?;
+
     conn.execute_batch(
         "
+        CREATE UNIQUE INDEX IF NOT EXISTS uq_assets_project_storage_uri ON assets(project_id, storage_uri);
         CREATE INDEX IF NOT EXISTS idx_projects_slug ON projects(slug);
         CREATE INDEX IF NOT EXISTS idx_projects_owner_slug ON projects(owner_user_id, slug);
         CREATE INDEX IF NOT EXISTS idx_runs_project_created ON runs(project_id, created_at);
@@ -1183,6 +1300,13 @@ fn ensure_schema(conn: &Connection) -> Result<(), ProjectsRepoError> {
         CREATE INDEX IF NOT EXISTS idx_api_tokens_user_created ON api_tokens(user_id, created_at);
         CREATE INDEX IF NOT EXISTS idx_api_tokens_project_created ON api_tokens(project_id, created_at);
         CREATE INDEX IF NOT EXISTS idx_audit_events_project_created ON audit_events(project_id, created_at);
+        CREATE INDEX IF NOT EXISTS idx_chat_sessions_project ON chat_sessions(project_id);
+        CREATE INDEX IF NOT EXISTS idx_chat_messages_project_session ON chat_messages(project_id, session_id);
+        CREATE INDEX IF NOT EXISTS idx_agent_instructions_project ON agent_instructions(project_id);
+        CREATE INDEX IF NOT EXISTS idx_agent_instructions_status ON agent_instructions(status);
+        CREATE INDEX IF NOT EXISTS idx_agent_instruction_events_instruction ON agent_instruction_events(project_id, instruction_id);
+
+        ANALYZE;
     ",
     )?;
 
@@ -1192,59 +1316,91 @@ fn ensure_schema(conn: &Connection) -> Result<(), ProjectsRepoError> {
     provider_style_character::ensure_provider_style_character_columns(conn)?;
     reference_sets::ensure_reference_set_columns(conn)?;
     secrets::ensure_secret_columns(conn)?;
+    conn.execute_batch(format!("PRAGMA user_version = {SCHEMA_VERSION};").as_str())?;
     Ok(())
 }
 
 fn configure_connection(conn: &Connection) -> Result<(), ProjectsRepoError> {
     conn.busy_timeout(Duration::from_secs(5))?;
+    // Room for every hot statement used by ingest and the API handlers;
+    // prepare_cached callers then reuse compiled statements for free.
+    conn.set_prepared_statement_cache_capacity(256);
     conn.execute_batch(
         "
         PRAGMA foreign_keys = ON;
         PRAGMA journal_mode = WAL;
         PRAGMA synchronous = NORMAL;
+        PRAGMA temp_store = MEMORY;
+        PRAGMA cache_size = -65536;
+        PRAGMA mmap_size = 268435456;
     ",
     )?;
     Ok(())
 }
 
-fn ensure_column(
-    conn: &Connection,
-    table: &str,
-    column: &str,
-    definition: &str,
-) -> Result<(), ProjectsRepoError> {
-    if table_has_column(conn, table, column)? {
+fn ensure_assets_storage_uri_unique(conn: &Connection) -> Result<(), ProjectsRepoError> {
+    // One-time dedupe before the UNIQUE index on (project_id, storage_uri)
+    // first exists; keep the most recently inserted row per key, matching
+    // what the old read-before-insert upsert picked.
+    let index_exists = conn
+        .query_row(
+            "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'uq_assets_project_storage_uri'",
+            [],
+            |_| Ok(()),
+        )
+        .optional()?
+        .is_some();
+    if index_exists {
         return Ok(());
     }
     conn.execute(
-        format!("ALTER TABLE {table} ADD COLUMN {column} {definition}").as_str(),
+        "
+        DELETE FROM assets
+        WHERE storage_uri IS NOT NULL
+          AND rowid NOT IN (SELECT MAX(rowid) FROM assets GROUP BY project_id, storage_uri)
+        ",
         [],
     )?;
     Ok(())
 }
 
-fn table_has_column(
+fn ensure_columns(
     conn: &Connection,
     table: &str,
-    column: &str,
-) -> Result<bool, ProjectsRepoError> {
+    columns: &[(&str, &str)],
+) -> Result<(), ProjectsRepoError> {
+    // One PRAGMA table_info per table instead of one per column; the
+    // migration sweep declares dozens of columns against a handful of
+    // tables, so the per-column introspection dominated schema init.
+    let existing = table_columns(conn, table)?;
+    for (column, definition) in columns {
+        if existing.contains(*column) {
+            continue;
+        }
+        conn.execute(
+            format!("ALTER TABLE {table} ADD COLUMN {column} {definition}").as_str(),
+            [],
+        )?;
+    }
+    Ok(())
+}
+
+fn table_columns(conn: &Connection, table: &str) -> Result<HashSet<String>, ProjectsRepoError> {
     let pragma = format!("PRAGMA table_info({table})");
     let mut stmt = conn.prepare(pragma.as_str())?;
     let mut rows = stmt.query([])?;
+    let mut out = HashSet::new();
     while let Some(row) = rows.next()? {
-        let name: String = row.get("name")?;
-        if name == column {
-            return Ok(true);
-        }
+        out.insert(row.get::<_, String>("name")?);
     }
-    Ok(false)
+    Ok(out)
 }
 
 fn fetch_project_by_id(
     conn: &Connection,
     project_id: &str,
 ) -> Result<Option<ProjectRow>, ProjectsRepoError> {
-    let mut stmt = conn.prepare(
+    let mut stmt = conn.prepare_cached(
         "
         SELECT id, slug, name, description, status, settings_json, created_at, updated_at
         FROM projects
@@ -1261,7 +1417,7 @@ fn fetch_project_by_slug(
     conn: &Connection,
     slug: &str,
 ) -> Result<Option<ProjectRow>, ProjectsRepoError> {
-    let mut stmt = conn.prepare(
+    let mut stmt = conn.prepare_cached(
         "
         SELECT id, slug, name, description, status, settings_json, created_at, updated_at
         FROM projects
@@ -1279,7 +1435,7 @@ fn fetch_project_by_slug_for_user(
     slug: &str,
     user_id: &str,
 ) -> Result<Option<ProjectRow>, ProjectsRepoError> {
-    let mut stmt = conn.prepare(
+    let mut stmt = conn.prepare_cached(
         "
         SELECT id, slug, name, description, status, settings_json, created_at, updated_at
         FROM projects
@@ -1364,8 +1520,13 @@ fn row_string_from_columns(row: &rusqlite::Row<'_>, columns: &[&str]) -> rusqlit
 }
 
 fn parse_json_value(raw: Option<String>) -> Value {
-    raw.and_then(|text| serde_json::from_str::<Value>(text.as_str()).ok())
-        .unwrap_or_else(|| Value::Object(serde_json::Map::new()))
+    // Most stored payload columns hold the empty-object default; skip the
+    // parser for those instead of tokenizing "{}" on every row.
+    match raw.as_deref().map(str::trim) {
+        None | Some("") | Some("{}") => Value::Object(serde_json::Map::new()),
+        Some(text) => serde_json::from_str::<Value>(text)
+            .unwrap_or_else(|_| Value::Object(serde_json::Map::new())),
+    }
 }
 
 fn ensure_user(
@@ -1376,51 +1537,47 @@ fn ensure_user(
     let safe_username = slugify(username);
     let now = now_iso();
 
-    let existing_app_user_id = conn
-        .query_row(
-            "SELECT id FROM app_users WHERE username = ?1 LIMIT 1",
-            [safe_username.as_str()],
-            |row| row.get::<_, String>(0),
-        )
-        .optional()?;
-    let existing_legacy_user_id = conn
+    // One round trip over both user tables; app_users wins when the
+    // username exists in each, matching the old sequential lookups.
+    let existing_user_id = conn
         .query_row(
-            "SELECT id FROM users WHERE username = ?1 LIMIT 1",
+            "
+            SELECT id FROM (
+              SELECT id, 0 AS pref FROM app_users WHERE username = ?1
+              UNION ALL
+              SELECT id, 1 AS pref FROM users WHERE username = ?1
+            )
+            ORDER BY pref
+            LIMIT 1
+            ",
             [safe_username.as_str()],
             |row| row.get::<_, String>(0),
         )
         .optional()?;
 
-    let user_id = existing_app_user_id
-        .or(existing_legacy_user_id)
-        .unwrap_or_else(|| Uuid::new_v4().to_string());
+    let user_id = existing_user_id.unwrap_or_else(|| Uuid::new_v4().to_string());
 
-    conn.execute(
-        "
-        INSERT INTO app_users (id, username, display_name, email, is_active, created_at, updated_at)
-        VALUES (?1, ?2, ?3, NULL, 1, ?4, ?4)
-        ON CONFLICT(id) DO UPDATE SET
-          username = excluded.username,
-          display_name = excluded.display_name,
-          email = NULL,
-          is_active = 1,
-          updated_at = excluded.updated_at
-    ",
-        params![user_id, safe_username, display_name, now],
-    )?;
-    conn.execute(
-        "
-        INSERT INTO users (id, username, display_name, email, is_active, created_at, updated_at)
-        VALUES (?1, ?2, ?3, NULL, 1, ?4, ?4)
-        ON CONFLICT(id) DO UPDATE SET
-          username = excluded.username,
-          display_name = excluded.display_name,
-          email = NULL,
-          is_active = 1,
-          updated_at = excluded.updated_at
-    ",
-        params![user_id, safe_username, display_name, now],
-    )?;
+    // The two tables share a schema, so the same upsert text (modulo the
+    // table name) runs against both; prepare_cached keeps each compiled
+    // across the frequent ensure_user calls.
+    for table in ["app_users", "users"] {
+        let mut stmt = conn.prepare_cached(
+            format!(
+                "
+                INSERT INTO {table} (id, username, display_name, email, is_active, created_at, updated_at)
+                VALUES (?1, ?2, ?3, NULL, 1, ?4, ?4)
+                ON CONFLICT(id) DO UPDATE SET
+                  username = excluded.username,
+                  display_name = excluded.display_name,
+                  email = NULL,
+                  is_active = 1,
+                  updated_at = excluded.updated_at
+                "
+            )
+            .as_str(),
+        )?;
+        stmt.execute(params![user_id, safe_username, display_name, now])?;
+    }
 
     Ok(user_id)
 }
@@ -1435,20 +1592,22 @@ fn ensure_project(
     let safe_slug = slugify(slug);
     let now = now_iso();
 
+    // One parameterized probe for both ownership columns; an
+    // owner_user_id match outranks a legacy user_id match, mirroring the
+    // old query ordering.
     let existing_id = conn
         .query_row(
-            "SELECT id FROM projects WHERE owner_user_id = ?1 AND slug = ?2 LIMIT 1",
+            "
+            SELECT id
+            FROM projects
+            WHERE (owner_user_id = ?1 OR user_id = ?1) AND slug = ?2
+            ORDER BY CASE WHEN owner_user_id = ?1 THEN 0 ELSE 1 END
+            LIMIT 1
+            ",
             params![owner_user_id, safe_slug],
             |row| row.get::<_, String>(0),
         )
-        .optional()?
-        .or(conn
-            .query_row(
-                "SELECT id FROM projects WHERE user_id = ?1 AND slug = ?2 LIMIT 1",
-                params![owner_user_id, safe_slug],
-                |row| row.get::<_, String>(0),
-            )
-            .optional()?);
+        .optional()?;
 
     if let Some(project_id) = existing_id {
         conn.execute(
@@ -1861,14 +2020,6 @@ fn parse_storage_defaults(settings_json: &str) -> StorageDefaults {
     }
 }
 
-fn query_count<P>(conn: &Connection, sql: &str, params: P) -> Result<i64, ProjectsRepoError>
-where
-    P: rusqlite::Params,
-{
-    conn.query_row(sql, params, |row| row.get::<_, i64>(0))
-        .map_err(ProjectsRepoError::from)
-}
-
 fn now_iso() -> String {
     Utc::now().format("%Y-%m-%dT%H:%M:%SZ").to_string()
 }
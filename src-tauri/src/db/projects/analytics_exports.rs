@@ -3,7 +3,7 @@ use serde::Serialize;
 use serde_json::Value;
 
 use super::{
-    ensure_column, fetch_project_by_slug, normalize_slug, parse_json_value, ProjectsRepoError,
+    ensure_columns, fetch_project_by_slug, normalize_slug, parse_json_value, ProjectsRepoError,
     ProjectsStore,
 };
 
@@ -67,7 +67,7 @@ impl ProjectsStore {
                 .ok_or(ProjectsRepoError::NotFound)?;
             let capped = limit.clamp(1, 2000);
 
-            let mut stmt = conn.prepare(
+            let mut stmt = conn.prepare_cached(
                 "
                 SELECT
                   id,
@@ -108,7 +108,7 @@ impl ProjectsStore {
                 .ok_or(ProjectsRepoError::NotFound)?;
             let capped = limit.clamp(1, 2000);
 
-            let mut stmt = conn.prepare(
+            let mut stmt = conn.prepare_cached(
                 "
                 SELECT
                   id,
@@ -150,7 +150,7 @@ impl ProjectsStore {
                 .ok_or(ProjectsRepoError::NotFound)?;
             let capped = limit.clamp(1, 2000);
 
-            let mut stmt = conn.prepare(
+            let mut stmt = conn.prepare_cached(
                 "
                 SELECT
                   id,
@@ -273,43 +273,61 @@ pub(super) fn ensure_analytics_export_tables(conn: &Connection) -> Result<(), Pr
 }
 
 pub(super) fn ensure_analytics_export_columns(conn: &Connection) -> Result<(), ProjectsRepoError> {
-    ensure_column(conn, "quality_reports", "project_id", "TEXT NOT NULL")?;
-    ensure_column(conn, "quality_reports", "run_id", "TEXT")?;
-    ensure_column(conn, "quality_reports", "asset_id", "TEXT")?;
-    ensure_column(conn, "quality_reports", "report_type", "TEXT")?;
-    ensure_column(conn, "quality_reports", "grade", "TEXT")?;
-    ensure_column(conn, "quality_reports", "hard_failures", "INTEGER")?;
-    ensure_column(conn, "quality_reports", "soft_warnings", "INTEGER")?;
-    ensure_column(conn, "quality_reports", "avg_chroma_exceed", "REAL")?;
-    ensure_column(conn, "quality_reports", "summary_json", "TEXT")?;
-    ensure_column(conn, "quality_reports", "meta_json", "TEXT")?;
-    ensure_column(conn, "quality_reports", "created_at", "TEXT")?;
+    ensure_columns(
+        conn,
+        "quality_reports",
+        &[
+            ("project_id", "TEXT NOT NULL"),
+            ("run_id", "TEXT"),
+            ("asset_id", "TEXT"),
+            ("report_type", "TEXT"),
+            ("grade", "TEXT"),
+            ("hard_failures", "INTEGER"),
+            ("soft_warnings", "INTEGER"),
+            ("avg_chroma_exceed", "REAL"),
+            ("summary_json", "TEXT"),
+            ("meta_json", "TEXT"),
+            ("created_at", "TEXT"),
+        ],
+    )?;
 
-    ensure_column(conn, "cost_events", "project_id", "TEXT NOT NULL")?;
-    ensure_column(conn, "cost_events", "run_id", "TEXT")?;
-    ensure_column(conn, "cost_events", "job_id", "TEXT")?;
-    ensure_column(conn, "cost_events", "provider_code", "TEXT")?;
-    ensure_column(conn, "cost_events", "model_name", "TEXT")?;
-    ensure_column(conn, "cost_events", "event_type", "TEXT")?;
-    ensure_column(conn, "cost_events", "units", "REAL")?;
-    ensure_column(conn, "cost_events", "unit_cost_usd", "REAL")?;
-    ensure_column(conn, "cost_events", "total_cost_usd", "REAL")?;
-    ensure_column(conn, "cost_events", "currency", "TEXT")?;
-    ensure_column(conn, "cost_events", "meta_json", "TEXT")?;
-    ensure_column(conn, "cost_events", "created_at", "TEXT")?;
+    ensure_columns(
+        conn,
+        "cost_events",
+        &[
+            ("project_id", "TEXT NOT NULL"),
+            ("run_id", "TEXT"),
+            ("job_id", "TEXT"),
+            ("provider_code", "TEXT"),
+            ("model_name", "TEXT"),
+            ("event_type", "TEXT"),
+            ("units", "REAL"),
+            ("unit_cost_usd", "REAL"),
+            ("total_cost_usd", "REAL"),
+            ("currency", "TEXT"),
+            ("meta_json", "TEXT"),
+            ("created_at", "TEXT"),
+        ],
+    )?;
 
-    ensure_column(conn, "project_exports", "project_id", "TEXT NOT NULL")?;
-    ensure_column(conn, "project_exports", "run_id", "TEXT")?;
-    ensure_column(conn, "project_exports", "status", "TEXT")?;
-    ensure_column(conn, "project_exports", "export_format", "TEXT")?;
-    ensure_column(conn, "project_exports", "storage_uri", "TEXT")?;
-    ensure_column(conn, "project_exports", "rel_path", "TEXT")?;
-    ensure_column(conn, "project_exports", "file_size_bytes", "INTEGER")?;
-    ensure_column(conn, "project_exports", "checksum_sha256", "TEXT")?;
-    ensure_column(conn, "project_exports", "manifest_json", "TEXT")?;
-    ensure_column(conn, "project_exports", "meta_json", "TEXT")?;
-    ensure_column(conn, "project_exports", "created_at", "TEXT")?;
-    ensure_column(conn, "project_exports", "completed_at", "TEXT")?;
+    ensure_columns(
+        conn,
+        "project_exports",
+        &[
+            ("project_id", "TEXT NOT NULL"),
+            ("run_id", "TEXT"),
+            ("status", "TEXT"),
+            ("export_format", "TEXT"),
+            ("storage_uri", "TEXT"),
+            ("rel_path", "TEXT"),
+            ("file_size_bytes", "INTEGER"),
+            ("checksum_sha256", "TEXT"),
+            ("manifest_json", "TEXT"),
+            ("meta_json", "TEXT"),
+            ("created_at", "TEXT"),
+            ("completed_at", "TEXT"),
+        ],
+    )?;
 
     Ok(())
 }
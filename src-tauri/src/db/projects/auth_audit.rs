@@ -298,7 +298,7 @@ impl ProjectsStore {
 
     pub fn list_api_tokens(&self) -> Result<Vec<ApiTokenSummary>, ProjectsRepoError> {
         self.with_connection(|conn| {
-            let mut stmt = conn.prepare(
+            let mut stmt = conn.prepare_cached(
                 "
                 SELECT
                   id,
@@ -314,10 +314,12 @@ impl ProjectsStore {
                 ORDER BY created_at DESC
                 ",
             )?;
+            // One timestamp for the whole listing; formatting it per row adds
+            // nothing but allocation.
+            let now = now_iso();
             let rows = stmt.query_map([], |row| {
                 let revoked_at = row.get::<_, Option<String>>("revoked_at")?;
                 let expires_at = row.get::<_, Option<String>>("expires_at")?;
-                let now = now_iso();
                 let active = revoked_at.is_none()
                     && expires_at
                         .as_deref()
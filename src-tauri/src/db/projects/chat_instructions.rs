@@ -1,11 +1,11 @@
 use chrono::{Duration, Utc};
-use rusqlite::{params, Connection, OptionalExtension};
+use rusqlite::{params, Connection, OptionalExtension, TransactionBehavior};
 use serde::{Deserialize, Serialize};
 use serde_json::Value;
 use uuid::Uuid;
 
 use super::{
-    ensure_column, fetch_project_by_slug, normalize_chat_role, normalize_optional_storage_field,
+    ensure_columns, fetch_project_by_slug, normalize_chat_role, normalize_optional_storage_field,
     normalize_required_text, normalize_slug, now_iso, AgentInstructionWorkerLease,
     ProjectsRepoError, ProjectsStore,
 };
@@ -88,7 +88,7 @@ impl ProjectsStore {
             let project = fetch_project_by_slug(conn, safe_slug.as_str())?
                 .ok_or(ProjectsRepoError::NotFound)?;
 
-            let mut stmt = conn.prepare(
+            let mut stmt = conn.prepare_cached(
                 "
                 SELECT id, project_id, title, status, created_at, updated_at
                 FROM chat_sessions
@@ -162,13 +162,11 @@ impl ProjectsStore {
             let safe_slug = normalize_slug(slug).ok_or(ProjectsRepoError::NotFound)?;
             let project = fetch_project_by_slug(conn, safe_slug.as_str())?
                 .ok_or(ProjectsRepoError::NotFound)?;
-            let session_exists =
-                fetch_chat_session_by_id(conn, project.id.as_str(), session_id)?.is_some();
-            if !session_exists {
+            if !chat_session_exists(conn, project.id.as_str(), session_id)? {
                 return Err(ProjectsRepoError::NotFound);
             }
 
-            let mut stmt = conn.prepare(
+            let mut stmt = conn.prepare_cached(
                 "
                 SELECT id, project_id, session_id, role, content, created_at
                 FROM chat_messages
@@ -199,26 +197,34 @@ impl ProjectsStore {
             let safe_slug = normalize_slug(slug).ok_or(ProjectsRepoError::NotFound)?;
             let project = fetch_project_by_slug(conn, safe_slug.as_str())?
                 .ok_or(ProjectsRepoError::NotFound)?;
-            let session_exists =
-                fetch_chat_session_by_id(conn, project.id.as_str(), session_id)?.is_some();
-            if !session_exists {
+            if !chat_session_exists(conn, project.id.as_str(), session_id)? {
                 return Err(ProjectsRepoError::NotFound);
             }
 
             let id = Uuid::new_v4().to_string();
             let now = now_iso();
-            conn.execute(
+            // Hot insert path: connections now outlive a single call, so
+            // the cached statement skips re-parsing on every message.
+            conn.prepare_cached(
                 "
                 INSERT INTO chat_messages
                   (id, project_id, session_id, role, content, created_at)
                 VALUES
                   (?1, ?2, ?3, ?4, ?5, ?6)
             ",
-                params![id, project.id, session_id, role, content, now],
-            )?;
-
-            fetch_chat_message_by_id(conn, project.id.as_str(), session_id, id.as_str())?
-                .ok_or(ProjectsRepoError::NotFound)
+            )?
+            .execute(params![id, project.id, session_id, role, content, now])?;
+
+            // Every column of the new row came from this call; no need to
+            // read it back just to rebuild the same summary.
+            Ok(ChatMessageSummary {
+                id,
+                project_id: project.id,
+                session_id: session_id.to_string(),
+                role,
+                content,
+                created_at: now,
+            })
         })
     }
 
@@ -231,7 +237,7 @@ impl ProjectsStore {
             let project = fetch_project_by_slug(conn, safe_slug.as_str())?
                 .ok_or(ProjectsRepoError::NotFound)?;
 
-            let mut stmt = conn.prepare(
+            let mut stmt = conn.prepare_cached(
                 "
                 SELECT
                   id,
@@ -271,25 +277,37 @@ impl ProjectsStore {
 
             let id = Uuid::new_v4().to_string();
             let now = now_iso();
-            conn.execute(
+            // One commit for the instruction row and its "created" event
+            // instead of two autocommitted inserts.
+            let tx = conn.transaction_with_behavior(TransactionBehavior::Immediate)?;
+            tx.prepare_cached(
                 "
                 INSERT INTO agent_instructions
                   (id, project_id, instruction_text, status, created_at, updated_at, confirmed_at, canceled_at)
                 VALUES
                   (?1, ?2, ?3, 'pending', ?4, ?4, NULL, NULL)
             ",
-                params![id, project.id, instruction_text, now],
-            )?;
+            )?
+            .execute(params![id, project.id, instruction_text, now])?;
             record_agent_instruction_event(
-                conn,
+                &tx,
                 project.id.as_str(),
                 id.as_str(),
                 "created",
                 Some(String::from("Instruction created")),
             )?;
+            tx.commit()?;
 
-            fetch_agent_instruction_by_id(conn, project.id.as_str(), id.as_str())?
-                .ok_or(ProjectsRepoError::NotFound)
+            Ok(AgentInstructionSummary {
+                id,
+                project_id: project.id,
+                instruction_text,
+                status: String::from("pending"),
+                created_at: now.clone(),
+                updated_at: now,
+                confirmed_at: String::new(),
+                canceled_at: String::new(),
+            })
         })
     }
 
@@ -317,13 +335,11 @@ impl ProjectsStore {
             let safe_slug = normalize_slug(slug).ok_or(ProjectsRepoError::NotFound)?;
             let project = fetch_project_by_slug(conn, safe_slug.as_str())?
                 .ok_or(ProjectsRepoError::NotFound)?;
-            let instruction_exists =
-                fetch_agent_instruction_by_id(conn, project.id.as_str(), instruction_id)?.is_some();
-            if !instruction_exists {
+            if !agent_instruction_exists(conn, project.id.as_str(), instruction_id)? {
                 return Err(ProjectsRepoError::NotFound);
             }
 
-            let mut stmt = conn.prepare(
+            let mut stmt = conn.prepare_cached(
                 "
                 SELECT id, project_id, instruction_id, event_type, message, created_at
                 FROM agent_instruction_events
@@ -394,8 +410,15 @@ impl ProjectsStore {
                     .or(Some(String::from("Instruction confirmed"))),
             )?;
 
-            fetch_agent_instruction_by_id(conn, project.id.as_str(), instruction_id)?
-                .ok_or(ProjectsRepoError::NotFound)
+            // The UPDATE above touched known columns only; patch the row we
+            // already fetched instead of selecting it again.
+            Ok(AgentInstructionSummary {
+                status: String::from("confirmed"),
+                confirmed_at: now.clone(),
+                canceled_at: String::new(),
+                updated_at: now,
+                ..existing
+            })
         })
     }
 
@@ -447,8 +470,12 @@ impl ProjectsStore {
                     .or(Some(String::from("Instruction canceled"))),
             )?;
 
-            fetch_agent_instruction_by_id(conn, project.id.as_str(), instruction_id)?
-                .ok_or(ProjectsRepoError::NotFound)
+            Ok(AgentInstructionSummary {
+                status: String::from("canceled"),
+                canceled_at: now.clone(),
+                updated_at: now,
+                ..existing
+            })
         })
     }
 
@@ -468,7 +495,7 @@ impl ProjectsStore {
                 .format("%Y-%m-%dT%H:%M:%SZ")
                 .to_string();
 
-            let tx = conn.transaction()?;
+            let tx = conn.transaction_with_behavior(TransactionBehavior::Immediate)?;
             let lease = tx
                 .query_row(
                     "
@@ -540,7 +567,7 @@ impl ProjectsStore {
         let response_serialized = serde_json::to_string(response_json)
             .unwrap_or_else(|_| String::from("{\"ok\":false,\"error\":\"invalid_response\"}"));
         self.with_connection_mut(|conn| {
-            let tx = conn.transaction()?;
+            let tx = conn.transaction_with_behavior(TransactionBehavior::Immediate)?;
             tx.execute(
                 "
                 UPDATE agent_instructions
@@ -616,7 +643,7 @@ impl ProjectsStore {
             clean_error.to_string()
         };
         self.with_connection_mut(|conn| {
-            let tx = conn.transaction()?;
+            let tx = conn.transaction_with_behavior(TransactionBehavior::Immediate)?;
             tx.execute(
                 "
                 UPDATE agent_instructions
@@ -711,125 +738,76 @@ pub(super) fn ensure_chat_and_instruction_tables(
 pub(super) fn ensure_chat_and_instruction_columns(
     conn: &Connection,
 ) -> Result<(), ProjectsRepoError> {
-    ensure_column(conn, "chat_sessions", "project_id", "TEXT NOT NULL")?;
-    ensure_column(conn, "chat_sessions", "title", "TEXT NOT NULL DEFAULT ''")?;
-    ensure_column(
-        conn,
-        "chat_sessions",
-        "status",
-        "TEXT NOT NULL DEFAULT 'active'",
-    )?;
-    ensure_column(
+    ensure_columns(
         conn,
         "chat_sessions",
-        "created_at",
-        "TEXT NOT NULL DEFAULT ''",
-    )?;
-    ensure_column(
-        conn,
-        "chat_sessions",
-        "updated_at",
-        "TEXT NOT NULL DEFAULT ''",
+        &[
+            ("project_id", "TEXT NOT NULL"),
+            ("title", "TEXT NOT NULL DEFAULT ''"),
+            ("status", "TEXT NOT NULL DEFAULT 'active'"),
+            ("created_at", "TEXT NOT NULL DEFAULT ''"),
+            ("updated_at", "TEXT NOT NULL DEFAULT ''"),
+        ],
     )?;
 
-    ensure_column(conn, "chat_messages", "project_id", "TEXT NOT NULL")?;
-    ensure_column(conn, "chat_messages", "session_id", "TEXT NOT NULL")?;
-    ensure_column(
-        conn,
-        "chat_messages",
-        "role",
-        "TEXT NOT NULL DEFAULT 'user'",
-    )?;
-    ensure_column(conn, "chat_messages", "content", "TEXT NOT NULL DEFAULT ''")?;
-    ensure_column(
+    ensure_columns(
         conn,
         "chat_messages",
-        "created_at",
-        "TEXT NOT NULL DEFAULT ''",
+        &[
+            ("project_id", "TEXT NOT NULL"),
+            ("session_id", "TEXT NOT NULL"),
+            ("role", "TEXT NOT NULL DEFAULT 'user'"),
+            ("content", "TEXT NOT NULL DEFAULT ''"),
+            ("created_at", "TEXT NOT NULL DEFAULT ''"),
+        ],
     )?;
 
-    ensure_column(conn, "agent_instructions", "project_id", "TEXT NOT NULL")?;
-    ensure_column(
-        conn,
-        "agent_instructions",
-        "instruction_text",
-        "TEXT NOT NULL DEFAULT ''",
-    )?;
-    ensure_column(
-        conn,
-        "agent_instructions",
-        "status",
-        "TEXT NOT NULL DEFAULT 'pending'",
-    )?;
-    ensure_column(
-        conn,
-        "agent_instructions",
-        "created_at",
-        "TEXT NOT NULL DEFAULT ''",
-    )?;
-    ensure_column(
-        conn,
-        "agent_instructions",
-        "updated_at",
-        "TEXT NOT NULL DEFAULT ''",
-    )?;
-    ensure_column(conn, "agent_instructions", "confirmed_at", "TEXT")?;
-    ensure_column(conn, "agent_instructions", "canceled_at", "TEXT")?;
-    ensure_column(
+    ensure_columns(
         conn,
         "agent_instructions",
-        "attempts",
-        "INTEGER NOT NULL DEFAULT 0",
-    )?;
-    ensure_column(
-        conn,
-        "agent_instructions",
-        "max_attempts",
-        "INTEGER NOT NULL DEFAULT 3",
+        &[
+            ("project_id", "TEXT NOT NULL"),
+            ("instruction_text", "TEXT NOT NULL DEFAULT ''"),
+            ("status", "TEXT NOT NULL DEFAULT 'pending'"),
+            ("created_at", "TEXT NOT NULL DEFAULT ''"),
+            ("updated_at", "TEXT NOT NULL DEFAULT ''"),
+            ("confirmed_at", "TEXT"),
+            ("canceled_at", "TEXT"),
+            ("attempts", "INTEGER NOT NULL DEFAULT 0"),
+            ("max_attempts", "INTEGER NOT NULL DEFAULT 3"),
+            ("next_attempt_at", "TEXT"),
+            ("last_error", "TEXT"),
+            ("locked_by", "TEXT"),
+            ("locked_at", "TEXT"),
+            ("agent_response_json", "TEXT"),
+        ],
     )?;
-    ensure_column(conn, "agent_instructions", "next_attempt_at", "TEXT")?;
-    ensure_column(conn, "agent_instructions", "last_error", "TEXT")?;
-    ensure_column(conn, "agent_instructions", "locked_by", "TEXT")?;
-    ensure_column(conn, "agent_instructions", "locked_at", "TEXT")?;
-    ensure_column(conn, "agent_instructions", "agent_response_json", "TEXT")?;
 
-    ensure_column(
-        conn,
-        "agent_instruction_events",
-        "project_id",
-        "TEXT NOT NULL",
-    )?;
-    ensure_column(
+    ensure_columns(
         conn,
         "agent_instruction_events",
-        "instruction_id",
-        "TEXT NOT NULL",
-    )?;
-    ensure_column(
-        conn,
-        "agent_instruction_events",
-        "event_type",
-        "TEXT NOT NULL DEFAULT 'created'",
-    )?;
-    ensure_column(conn, "agent_instruction_events", "message", "TEXT")?;
-    ensure_column(
-        conn,
-        "agent_instruction_events",
-        "created_at",
-        "TEXT NOT NULL DEFAULT ''",
+        &[
+            ("project_id", "TEXT NOT NULL"),
+            ("instruction_id", "TEXT NOT NULL"),
+            ("event_type", "TEXT NOT NULL DEFAULT 'created'"),
+            ("message", "TEXT"),
+            ("created_at", "TEXT NOT NULL DEFAULT ''"),
+        ],
     )?;
 
     Ok(())
 }
 
 fn row_to_chat_session_summary(row: &rusqlite::Row<'_>) -> rusqlite::Result<ChatSessionSummary> {
+    // Positional gets skip the per-column name scan; every caller selects
+    // id, project_id, title, status, created_at, updated_at in this order.
     Ok(ChatSessionSummary {
-        id: row.get("id")?,
-        project_id: row.get("project_id")?,
-        title: row.get("title")?,
-        status: row.get("status")?,
-        created_at: row.get("created_at")?,
-        updated_at: row.get("updated_at")?,
+        id: row.get(0)?,
+        project_id: row.get(1)?,
+        title: row.get(2)?,
+        status: row.get(3)?,
+        created_at: row.get(4)?,
+        updated_at: row.get(5)?,
     })
 }
 
@@ -852,37 +830,50 @@ fn fetch_chat_session_by_id(
     .map_err(ProjectsRepoError::from)
 }
 
-fn row_to_chat_message_summary(row: &rusqlite::Row<'_>) -> rusqlite::Result<ChatMessageSummary> {
-    Ok(ChatMessageSummary {
-        id: row.get("id")?,
-        project_id: row.get("project_id")?,
-        session_id: row.get("session_id")?,
-        role: row.get("role")?,
-        content: row.get("content")?,
-        created_at: row.get("created_at")?,
-    })
+// Existence probes for 404 gating; the full fetch helpers hydrate every
+// column, which is wasted work when only the yes/no answer is consumed.
+fn chat_session_exists(
+    conn: &Connection,
+    project_id: &str,
+    session_id: &str,
+) -> Result<bool, ProjectsRepoError> {
+    conn.query_row(
+        "SELECT 1 FROM chat_sessions WHERE id = ?1 AND project_id = ?2 LIMIT 1",
+        params![session_id, project_id],
+        |_| Ok(()),
+    )
+    .optional()
+    .map(|found| found.is_some())
+    .map_err(ProjectsRepoError::from)
 }
 
-fn fetch_chat_message_by_id(
+fn agent_instruction_exists(
     conn: &Connection,
     project_id: &str,
-    session_id: &str,
-    message_id: &str,
-) -> Result<Option<ChatMessageSummary>, ProjectsRepoError> {
+    instruction_id: &str,
+) -> Result<bool, ProjectsRepoError> {
     conn.query_row(
-        "
-        SELECT id, project_id, session_id, role, content, created_at
-        FROM chat_messages
-        WHERE id = ?1 AND project_id = ?2 AND session_id = ?3
-        LIMIT 1
-    ",
-        params![message_id, project_id, session_id],
-        row_to_chat_message_summary,
+        "SELECT 1 FROM agent_instructions WHERE id = ?1 AND project_id = ?2 LIMIT 1",
+        params![instruction_id, project_id],
+        |_| Ok(()),
     )
     .optional()
+    .map(|found| found.is_some())
     .map_err(ProjectsRepoError::from)
 }
 
+fn row_to_chat_message_summary(row: &rusqlite::Row<'_>) -> rusqlite::Result<ChatMessageSummary> {
+    // Callers select id, project_id, session_id, role, content, created_at.
+    Ok(ChatMessageSummary {
+        id: row.get(0)?,
+        project_id: row.get(1)?,
+        session_id: row.get(2)?,
+        role: row.get(3)?,
+        content: row.get(4)?,
+        created_at: row.get(5)?,
+    })
+}
+
 fn row_to_agent_instruction_summary(
     row: &rusqlite::Row<'_>,
 ) -> rusqlite::Result<AgentInstructionSummary> {
@@ -945,13 +936,15 @@ fn fetch_agent_instruction_by_id(
 fn row_to_agent_instruction_event_summary(
     row: &rusqlite::Row<'_>,
 ) -> rusqlite::Result<AgentInstructionEventSummary> {
+    // Callers select id, project_id, instruction_id, event_type, message,
+    // created_at.
     Ok(AgentInstructionEventSummary {
-        id: row.get("id")?,
-        project_id: row.get("project_id")?,
-        instruction_id: row.get("instruction_id")?,
-        event_type: row.get("event_type")?,
-        message: row.get::<_, Option<String>>("message")?.unwrap_or_default(),
-        created_at: row.get("created_at")?,
+        id: row.get(0)?,
+        project_id: row.get(1)?,
+        instruction_id: row.get(2)?,
+        event_type: row.get(3)?,
+        message: row.get::<_, Option<String>>(4)?.unwrap_or_default(),
+        created_at: row.get(5)?,
     })
 }
 
@@ -962,21 +955,21 @@ fn record_agent_instruction_event(
     event_type: &str,
     message: Option<String>,
 ) -> Result<(), ProjectsRepoError> {
-    conn.execute(
+    conn.prepare_cached(
         "
         INSERT INTO agent_instruction_events
           (id, project_id, instruction_id, event_type, message, created_at)
         VALUES
           (?1, ?2, ?3, ?4, ?5, ?6)
     ",
-        params![
-            Uuid::new_v4().to_string(),
-            project_id,
-            instruction_id,
-            event_type,
-            message,
-            now_iso()
-        ],
-    )?;
+    )?
+    .execute(params![
+        Uuid::new_v4().to_string(),
+        project_id,
+        instruction_id,
+        event_type,
+        message,
+        now_iso()
+    ])?;
     Ok(())
 }
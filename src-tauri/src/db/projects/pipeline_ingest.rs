@@ -1,7 +1,7 @@
 use std::fs;
 use std::path::{Path, PathBuf};
 
-use rusqlite::{params, Connection, OptionalExtension};
+use rusqlite::{params, Connection, OptionalExtension, TransactionBehavior};
 use serde::Serialize;
 use serde_json::{json, Value};
 use sha2::{Digest, Sha256};
@@ -58,7 +58,9 @@ impl ProjectsStore {
 
             let run_data = read_run_log_json(resolved_run_log_path.as_path())?;
 
-            let tx = conn.transaction()?;
+            // Grab the write lock up front: the whole ingest is writes,
+            // so there is no point starting deferred and upgrading later.
+            let tx = conn.transaction_with_behavior(TransactionBehavior::Immediate)?;
 
             let mut project = fetch_project_by_slug(&tx, safe_slug.as_str())?;
             if project.is_none() && input.create_project_if_missing {
@@ -184,6 +186,7 @@ fn ingest_run_tx(
     let mut inserted_assets: u64 = 0;
     let mut quality_reports_written: u64 = 0;
     let mut cost_events_written: u64 = 0;
+    let mut pending_hashes: Vec<(String, PathBuf)> = Vec::new();
 
     let jobs = run_data
         .get("jobs")
@@ -191,6 +194,25 @@ fn ingest_run_tx(
         .cloned()
         .unwrap_or_default();
 
+    // Prepare the per-row INSERTs once; the loops below only bind and
+    // step, instead of re-parsing the same SQL for every row.
+    let mut insert_job_stmt = conn.prepare(
+        "
+        INSERT INTO run_jobs
+          (id, run_id, job_key, status, selected_candidate, selected_candidate_index, final_output, final_asset_id,
+           prompt_text, meta_json, created_at)
+        VALUES (?1, ?2, ?3, ?4, ?5, ?5, ?6, NULL, ?7, ?8, ?9)
+        ",
+    )?;
+    let mut insert_run_candidate_stmt = conn.prepare(
+        "
+        INSERT INTO run_candidates
+          (id, job_id, candidate_index, status, output_asset_id, final_asset_id,
+           output_path, final_output_path, rank_hard_failures, rank_soft_warnings, rank_avg_chroma_exceed, meta_json, created_at)
+        VALUES (?1, ?2, ?3, ?4, ?5, ?6, ?7, ?8, ?9, ?10, ?11, ?12, ?13)
+        ",
+    )?;
+
     for (idx, job) in jobs.iter().enumerate() {
         let Some(job_obj) = job.as_object() else {
             continue;
@@ -205,13 +227,7 @@ fn ingest_run_tx(
             .and_then(normalize_rel_path_opt);
         let prompt_text = first_non_empty_str(&[job_obj.get("prompt"), job_obj.get("prompt_text")]);
 
-        conn.execute(
-            "
-            INSERT INTO run_jobs
-              (id, run_id, job_key, status, selected_candidate, selected_candidate_index, final_output, final_asset_id,
-               prompt_text, meta_json, created_at)
-            VALUES (?1, ?2, ?3, ?4, ?5, ?5, ?6, NULL, ?7, ?8, ?9)
-            ",
+        insert_job_stmt.execute(
             params![
                 job_id,
                 run_id,
@@ -269,29 +285,14 @@ fn ingest_run_tx(
                 .get("final_output")
                 .and_then(Value::as_str)
                 .and_then(normalize_rel_path_opt);
-
-            conn.execute(
-                "
-                INSERT INTO run_job_candidates
-                  (id, job_id, candidate_index, status, output_path, final_output_path,
-                   rank_hard_failures, rank_soft_warnings, rank_avg_chroma_exceed, meta_json, created_at)
-                VALUES (?1, ?2, ?3, ?4, ?5, ?6, ?7, ?8, ?9, ?10, ?11)
-                ",
-                params![
-                    candidate_id,
-                    job_id,
-                    candidate_index,
-                    string_or_empty(candidate_obj.get("status")),
-                    output_path,
-                    final_output_path,
-                    number_to_i64(rank_obj.get("hard_failures")),
-                    number_to_i64(rank_obj.get("soft_warnings")),
-                    number_to_f64(rank_obj.get("avg_chroma_exceed")),
-                    serde_json::to_string(&candidate).unwrap_or_else(|_| String::from("{}")),
-                    ts,
-                ],
-            )?;
-            inserted_candidates += 1;
+            // Serialized once; both candidate tables store the same payload.
+            let candidate_meta_json =
+                serde_json::to_string(&candidate).unwrap_or_else(|_| String::from("{}"));
+            // Both candidate inserts and the quality report reuse these.
+            let candidate_status = string_or_empty(candidate_obj.get("status"));
+            let rank_hard_failures = number_to_i64(rank_obj.get("hard_failures"));
+            let rank_soft_warnings = number_to_i64(rank_obj.get("soft_warnings"));
+            let rank_avg_chroma_exceed = number_to_f64(rank_obj.get("avg_chroma_exceed"));
 
             let mut output_asset_id = None::<String>;
             let mut final_asset_id = None::<String>;
@@ -308,6 +309,8 @@ fn ingest_run_tx(
                     repo_root,
                     compute_hashes,
                     None,
+                    Some(ts.as_str()),
+                    &mut pending_hashes,
                 )?;
                 if output_asset_id.is_some() {
                     inserted_assets += 1;
@@ -329,6 +332,8 @@ fn ingest_run_tx(
                         repo_root,
                         compute_hashes,
                         None,
+                        Some(ts.as_str()),
+                        &mut pending_hashes,
                     )?;
                     if final_asset_id.is_some() {
                         inserted_assets += 1;
@@ -336,36 +341,31 @@ fn ingest_run_tx(
                 }
             }
 
-            conn.execute(
-                "
-                INSERT INTO run_candidates
-                  (id, job_id, candidate_index, status, output_asset_id, final_asset_id,
-                   output_path, final_output_path, rank_hard_failures, rank_soft_warnings, rank_avg_chroma_exceed, meta_json, created_at)
-                VALUES (?1, ?2, ?3, ?4, ?5, ?6, ?7, ?8, ?9, ?10, ?11, ?12, ?13)
-                ",
+            insert_run_candidate_stmt.execute(
                 params![
                     candidate_id,
                     job_id,
                     candidate_index,
-                    string_or_empty(candidate_obj.get("status")),
+                    candidate_status,
                     output_asset_id,
                     final_asset_id,
                     output_path,
                     final_output_path,
-                    number_to_i64(rank_obj.get("hard_failures")),
-                    number_to_i64(rank_obj.get("soft_warnings")),
-                    number_to_f64(rank_obj.get("avg_chroma_exceed")),
-                    serde_json::to_string(&candidate).unwrap_or_else(|_| String::from("{}")),
+                    rank_hard_failures,
+                    rank_soft_warnings,
+                    rank_avg_chroma_exceed,
+                    candidate_meta_json,
                     ts,
                 ],
             )?;
+            inserted_candidates += 1;
 
             let mut report_summary = json!({
-                "status": string_or_empty(candidate_obj.get("status")),
+                "status": candidate_status,
                 "rank": {
-                    "hard_failures": number_to_i64(rank_obj.get("hard_failures")),
-                    "soft_warnings": number_to_i64(rank_obj.get("soft_warnings")),
-                    "avg_chroma_exceed": number_to_f64(rank_obj.get("avg_chroma_exceed")),
+                    "hard_failures": rank_hard_failures,
+                    "soft_warnings": rank_soft_warnings,
+                    "avg_chroma_exceed": rank_avg_chroma_exceed,
                 },
                 "output_path": output_path,
                 "final_output_path": final_output_path,
@@ -403,6 +403,8 @@ fn ingest_run_tx(
                 Some(
                     json!({"selected_candidate": job_obj.get("selected_candidate").cloned().unwrap_or(Value::Null)}),
                 ),
+                Some(ts.as_str()),
+                &mut pending_hashes,
             )?;
             if final_asset_id.is_some() {
                 inserted_assets += 1;
@@ -450,6 +452,8 @@ fn ingest_run_tx(
         cost_events_written += 1;
     }
 
+    backfill_asset_hashes(conn, pending_hashes)?;
+
     Ok(IngestRunLogResult {
         project_slug: project.slug.clone(),
         run_id,
@@ -463,23 +467,72 @@ fn ingest_run_tx(
     })
 }
 
+const HASH_WORKERS: usize = 8;
+
+fn backfill_asset_hashes(
+    conn: &Connection,
+    pending: Vec<(String, PathBuf)>,
+) -> Result<(), ProjectsRepoError> {
+    if pending.is_empty() {
+        return Ok(());
+    }
+
+    // File reads dominate hashing time, so fan the queued files out over
+    // a few scoped threads while the single writer connection stays idle,
+    // then apply the results with one prepared UPDATE.
+    let chunk_size = pending.len().div_ceil(HASH_WORKERS.min(pending.len()));
+    let hashed: Vec<(String, Result<String, std::io::Error>)> = std::thread::scope(|scope| {
+        let handles: Vec<_> = pending
+            .chunks(chunk_size)
+            .map(|part| {
+                scope.spawn(move || {
+                    part.iter()
+                        .map(|(asset_id, path)| {
+                            (asset_id.clone(), sha256_of_file(path.as_path()))
+                        })
+                        .collect::<Vec<_>>()
+                })
+            })
+            .collect();
+        handles
+            .into_iter()
+            .flat_map(|handle| handle.join().unwrap_or_default())
+            .collect()
+    });
+
+    let mut stmt = conn.prepare_cached("UPDATE assets SET sha256 = ?1 WHERE id = ?2")?;
+    for (index, (asset_id, result)) in hashed.iter().enumerate() {
+        let digest = result.as_ref().map_err(|error| {
+            ProjectsRepoError::Validation(format!(
+                "Failed to hash asset '{}': {error}",
+                pending[index].1.display()
+            ))
+        })?;
+        stmt.execute(params![digest, asset_id])?;
+    }
+    Ok(())
+}
+
 fn derive_run_status(run_data: &Value) -> String {
     let Some(jobs) = run_data.get("jobs").and_then(Value::as_array) else {
         return String::from("unknown");
     };
-    let statuses: Vec<String> = jobs
-        .iter()
-        .filter_map(Value::as_object)
-        .map(|job| {
-            string_or_empty(job.get("status"))
-                .trim()
-                .to_ascii_lowercase()
-        })
-        .collect();
-    if statuses.iter().any(|s| s.starts_with("failed")) {
-        return String::from("failed");
+    // Single pass: any failure wins immediately, otherwise track whether
+    // every job reached a terminal status.
+    let mut saw_any = false;
+    let mut all_terminal = true;
+    for job in jobs.iter().filter_map(Value::as_object) {
+        let status = string_or_empty(job.get("status")).to_ascii_lowercase();
+        let status = status.trim();
+        saw_any = true;
+        if status.starts_with("failed") {
+            return String::from("failed");
+        }
+        if status != "done" && status != "planned" {
+            all_terminal = false;
+        }
     }
-    if !statuses.is_empty() && statuses.iter().all(|s| s == "done" || s == "planned") {
+    if saw_any && all_terminal {
         return String::from("ok");
     }
     String::from("partial")
@@ -511,12 +564,14 @@ fn insert_quality_report_tx(
         .map(|v| number_to_f64(Some(v)))
         .unwrap_or(0.0);
     let summary_json = serde_json::to_string(summary).unwrap_or_else(|_| String::from("{}"));
-    conn.execute(
+    let mut stmt = conn.prepare_cached(
         "
         INSERT INTO quality_reports
           (id, project_id, run_id, asset_id, report_type, grade, hard_failures, soft_warnings, avg_chroma_exceed, summary_json, meta_json, created_at)
         VALUES (?1, ?2, ?3, ?4, ?5, '', ?6, ?7, ?8, ?9, ?9, ?10)
         ",
+    )?;
+    stmt.execute(
         params![
             Uuid::new_v4().to_string(),
             project_id,
@@ -561,12 +616,14 @@ fn insert_cost_event_tx(
     let ts = created_at.map(ToOwned::to_owned).unwrap_or_else(now_iso);
     let meta_json = serde_json::to_string(meta.unwrap_or(&Value::Object(Default::default())))
         .unwrap_or_else(|_| String::from("{}"));
-    conn.execute(
+    let mut stmt = conn.prepare_cached(
         "
         INSERT INTO cost_events
           (id, project_id, run_id, job_id, provider_code, model_name, event_type, units, unit_cost_usd, total_cost_usd, currency, meta_json, created_at)
         VALUES (?1, ?2, ?3, ?4, ?5, ?6, ?7, ?8, ?9, ?10, ?11, ?12, ?13)
         ",
+    )?;
+    stmt.execute(
         params![
             Uuid::new_v4().to_string(),
             project_id,
@@ -597,23 +654,15 @@ fn upsert_asset_tx(
     repo_root: &Path,
     compute_hashes: bool,
     extra_meta: Option<Value>,
+    created_at: Option<&str>,
+    pending_hashes: &mut Vec<(String, PathBuf)>,
 ) -> Result<Option<String>, ProjectsRepoError> {
     let Some(clean_rel) = normalize_rel_path_opt(rel_path) else {
         return Ok(None);
     };
 
     let abs_path = repo_root.join(clean_rel.as_str());
-    let file_hash = if compute_hashes && abs_path.is_file() {
-        Some(sha256_of_file(abs_path.as_path()).map_err(|error| {
-            ProjectsRepoError::Validation(format!(
-                "Failed to hash asset '{}': {error}",
-                abs_path.display()
-            ))
-        })?)
-    } else {
-        None
-    };
-    let ts = now_iso();
+    let ts = created_at.map(ToOwned::to_owned).unwrap_or_else(now_iso);
 
     let mut payload = serde_json::Map::new();
     payload.insert(String::from("path_exists"), Value::Bool(abs_path.exists()));
@@ -625,71 +674,48 @@ fn upsert_asset_tx(
     let payload_json = serde_json::to_string(&Value::Object(payload.clone()))
         .unwrap_or_else(|_| String::from("{}"));
 
-    if let Some(existing_id) = conn
-        .query_row(
-            "
-            SELECT id
-            FROM assets
-            WHERE project_id = ?1 AND (rel_path = ?2 OR storage_uri = ?2)
-            ORDER BY COALESCE(created_at, '') DESC
-            LIMIT 1
-            ",
-            params![project_id, clean_rel],
-            |row| row.get::<_, String>(0),
-        )
-        .optional()?
-    {
-        conn.execute(
-            "
-            UPDATE assets
-            SET run_id = ?1,
-                job_id = ?2,
-                candidate_id = ?3,
-                asset_kind = ?4,
-                kind = ?4,
-                rel_path = ?5,
-                storage_uri = ?5,
-                sha256 = ?6,
-                meta_json = ?7,
-                metadata_json = ?7,
-                created_at = ?8
-            WHERE id = ?9
-            ",
-            params![
-                run_id,
-                job_id,
-                candidate_id,
-                asset_kind,
-                clean_rel,
-                file_hash,
-                payload_json,
-                ts,
-                existing_id,
-            ],
-        )?;
-        return Ok(Some(existing_id));
-    }
-
-    let asset_id = Uuid::new_v4().to_string();
-    conn.execute(
+    // Single round trip: insert, or update the existing row on the
+    // (project_id, storage_uri) key. RETURNING hands back the surviving
+    // row id, so updates keep their original asset id.
+    let mut stmt = conn.prepare_cached(
         "
         INSERT INTO assets
           (id, project_id, run_id, job_id, candidate_id, asset_kind, kind, rel_path, storage_uri, sha256, meta_json, metadata_json, created_at)
         VALUES (?1, ?2, ?3, ?4, ?5, ?6, ?6, ?7, ?7, ?8, ?9, ?9, ?10)
+        ON CONFLICT(project_id, storage_uri) DO UPDATE SET
+          run_id = excluded.run_id,
+          job_id = excluded.job_id,
+          candidate_id = excluded.candidate_id,
+          asset_kind = excluded.asset_kind,
+          kind = excluded.kind,
+          rel_path = excluded.rel_path,
+          sha256 = excluded.sha256,
+          meta_json = excluded.meta_json,
+          metadata_json = excluded.metadata_json,
+          created_at = excluded.created_at
+        RETURNING id
         ",
+    )?;
+    let asset_id = stmt.query_row(
         params![
-            asset_id,
+            Uuid::new_v4().to_string(),
             project_id,
             run_id,
             job_id,
             candidate_id,
             asset_kind,
             clean_rel,
-            file_hash,
+            None::<String>,
             payload_json,
             ts,
         ],
+        |row| row.get::<_, String>(0),
     )?;
+    // Hashing is deferred so file reads never block the write loop; the
+    // caller backfills sha256 for everything queued here after the loops.
+    if compute_hashes && abs_path.is_file() {
+        pending_hashes.push((asset_id.clone(), abs_path));
+    }
     Ok(Some(asset_id))
 }
 
@@ -726,7 +752,7 @@ fn extract_cost_event_rows(run_data: &Value) -> Vec<CostEventRow> {
                 .or_else(|| number_to_f64_opt(obj.get("quantity")))
                 .unwrap_or(0.0);
             let cost_usd = number_to_f64_opt(obj.get("cost_usd"))
-                .or_else(|| number_to_f64_opt(obj.get("amount_cents")).map(|v| v / 100.0))
+                .or_else(|| cents_to_usd_opt(obj.get("amount_cents")))
                 .unwrap_or(0.0);
             events.push(CostEventRow {
                 provider_code,
@@ -753,7 +779,7 @@ fn extract_cost_event_rows(run_data: &Value) -> Vec<CostEventRow> {
             .or_else(|| number_to_f64_opt(generation.get("count")))
             .unwrap_or(0.0);
         let cost_usd = number_to_f64_opt(generation.get("cost_usd"))
-            .or_else(|| number_to_f64_opt(generation.get("amount_cents")).map(|v| v / 100.0));
+            .or_else(|| cents_to_usd_opt(generation.get("amount_cents")));
         if let Some(cost_usd) = cost_usd {
             events.push(CostEventRow {
                 provider_code,
@@ -774,7 +800,7 @@ fn extract_cost_event_rows(run_data: &Value) -> Vec<CostEventRow> {
 
     if events.is_empty() {
         let top_level_cost = number_to_f64_opt(run_data.get("cost_usd"))
-            .or_else(|| number_to_f64_opt(run_data.get("amount_cents")).map(|v| v / 100.0));
+            .or_else(|| cents_to_usd_opt(run_data.get("amount_cents")));
         if let Some(cost_usd) = top_level_cost {
             events.push(CostEventRow {
                 provider_code: String::from("unknown"),
@@ -818,9 +844,24 @@ fn normalize_rel_path_string(value: &str) -> String {
 }
 
 fn sha256_of_file(path: &Path) -> Result<String, std::io::Error> {
-    let bytes = fs::read(path)?;
-    let digest = Sha256::digest(bytes);
-    Ok(format!("{digest:x}"))
+    // Stream the file through the hasher in fixed-size chunks instead of
+    // reading it whole; generated images can be tens of megabytes and the
+    // old fs::read pinned each one in memory just to hash it.
+    use std::io::Read;
+
+    let mut file = fs::File::open(path)?;
+    let mut hasher = Sha256::new();
+    // 1 MiB reads keep the kernel prefetching sequentially without
+    // pinning whole files in memory.
+    let mut buffer = vec![0u8; 1024 * 1024];
+    loop {
+        let read = file.read(buffer.as_mut_slice())?;
+        if read == 0 {
+            break;
+        }
+        hasher.update(&buffer[..read]);
+    }
+    Ok(format!("{:x}", hasher.finalize()))
 }
 
 fn get_str(value: &Value, key: &str) -> String {
@@ -870,6 +911,23 @@ fn number_to_f64(value: Option<&Value>) -> f64 {
     number_to_f64_opt(value).unwrap_or(0.0)
 }
 
+fn cents_to_usd_opt(value: Option<&Value>) -> Option<f64> {
+    // Cents arrive as integers (or integer strings); convert them with
+    // integer arithmetic so the whole-dollar part never goes through a
+    // float multiply. Fractional-cent payloads fall back to float math.
+    let cents = match value {
+        Some(Value::Number(n)) => n
+            .as_i64()
+            .or_else(|| n.as_u64().and_then(|v| i64::try_from(v).ok())),
+        Some(Value::String(s)) => s.trim().parse::<i64>().ok(),
+        _ => None,
+    };
+    if let Some(cents) = cents {
+        return Some((cents / 100) as f64 + (cents % 100) as f64 / 100.0);
+    }
+    number_to_f64_opt(value).map(|v| v / 100.0)
+}
+
 fn number_to_f64_opt(value: Option<&Value>) -> Option<f64> {
     match value {
         Some(Value::Number(n)) => n.as_f64(),
@@ -3,7 +3,7 @@ use serde::{Deserialize, Serialize};
 use uuid::Uuid;
 
 use super::{
-    ensure_column, fetch_project_by_slug, is_unique_constraint_error, normalize_required_text,
+    ensure_columns, fetch_project_by_slug, is_unique_constraint_error, normalize_required_text,
     normalize_slug, now_iso, ProjectsRepoError, ProjectsStore,
 };
 
@@ -43,7 +43,7 @@ impl ProjectsStore {
             let project = fetch_project_by_slug(conn, safe_slug.as_str())?
                 .ok_or(ProjectsRepoError::NotFound)?;
 
-            let mut stmt = conn.prepare(
+            let mut stmt = conn.prepare_cached(
                 "
                 SELECT id, project_id, name, template_text, created_at, updated_at
                 FROM prompt_templates
@@ -207,25 +207,16 @@ pub(super) fn ensure_prompt_template_tables(conn: &Connection) -> Result<(), Pro
 }
 
 pub(super) fn ensure_prompt_template_columns(conn: &Connection) -> Result<(), ProjectsRepoError> {
-    ensure_column(conn, "prompt_templates", "project_id", "TEXT NOT NULL")?;
-    ensure_column(conn, "prompt_templates", "name", "TEXT NOT NULL")?;
-    ensure_column(
+    ensure_columns(
         conn,
         "prompt_templates",
-        "template_text",
-        "TEXT NOT NULL DEFAULT ''",
-    )?;
-    ensure_column(
-        conn,
-        "prompt_templates",
-        "created_at",
-        "TEXT NOT NULL DEFAULT ''",
-    )?;
-    ensure_column(
-        conn,
-        "prompt_templates",
-        "updated_at",
-        "TEXT NOT NULL DEFAULT ''",
+        &[
+            ("project_id", "TEXT NOT NULL"),
+            ("name", "TEXT NOT NULL"),
+            ("template_text", "TEXT NOT NULL DEFAULT ''"),
+            ("created_at", "TEXT NOT NULL DEFAULT ''"),
+            ("updated_at", "TEXT NOT NULL DEFAULT ''"),
+        ],
     )?;
 
     Ok(())
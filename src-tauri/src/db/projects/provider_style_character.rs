@@ -4,7 +4,7 @@ use serde_json::Value;
 use uuid::Uuid;
 
 use super::{
-    ensure_column, fetch_project_by_slug, is_unique_constraint_error,
+    ensure_columns, fetch_project_by_slug, is_unique_constraint_error,
     normalize_optional_storage_field, normalize_provider_code, normalize_required_text,
     normalize_slug, now_iso, parse_json_value, ProjectsRepoError, ProjectsStore,
 };
@@ -124,7 +124,7 @@ impl ProjectsStore {
             let project = fetch_project_by_slug(conn, safe_slug.as_str())?
                 .ok_or(ProjectsRepoError::NotFound)?;
 
-            let mut stmt = conn.prepare(
+            let mut stmt = conn.prepare_cached(
                 "
                 SELECT
                   project_id,
@@ -346,7 +346,7 @@ impl ProjectsStore {
             let project = fetch_project_by_slug(conn, safe_slug.as_str())?
                 .ok_or(ProjectsRepoError::NotFound)?;
 
-            let mut stmt = conn.prepare(
+            let mut stmt = conn.prepare_cached(
                 "
                 SELECT id, project_id, name, instructions, notes, created_at, updated_at
                 FROM style_guides
@@ -513,7 +513,7 @@ impl ProjectsStore {
             let project = fetch_project_by_slug(conn, safe_slug.as_str())?
                 .ok_or(ProjectsRepoError::NotFound)?;
 
-            let mut stmt = conn.prepare(
+            let mut stmt = conn.prepare_cached(
                 "
                 SELECT id, project_id, name, description, prompt_text, created_at, updated_at
                 FROM characters
@@ -727,70 +727,48 @@ pub(super) fn ensure_provider_style_character_tables(
 pub(super) fn ensure_provider_style_character_columns(
     conn: &Connection,
 ) -> Result<(), ProjectsRepoError> {
-    ensure_column(conn, "provider_accounts", "project_id", "TEXT NOT NULL")?;
-    ensure_column(conn, "provider_accounts", "provider_code", "TEXT NOT NULL")?;
-    ensure_column(
+    ensure_columns(
         conn,
         "provider_accounts",
-        "display_name",
-        "TEXT NOT NULL DEFAULT ''",
-    )?;
-    ensure_column(conn, "provider_accounts", "account_ref", "TEXT")?;
-    ensure_column(conn, "provider_accounts", "base_url", "TEXT")?;
-    ensure_column(
-        conn,
-        "provider_accounts",
-        "enabled",
-        "INTEGER NOT NULL DEFAULT 1",
-    )?;
-    ensure_column(
-        conn,
-        "provider_accounts",
-        "config_json",
-        "TEXT NOT NULL DEFAULT '{}'",
-    )?;
-    ensure_column(
-        conn,
-        "provider_accounts",
-        "created_at",
-        "TEXT NOT NULL DEFAULT ''",
-    )?;
-    ensure_column(
-        conn,
-        "provider_accounts",
-        "updated_at",
-        "TEXT NOT NULL DEFAULT ''",
+        &[
+            ("project_id", "TEXT NOT NULL"),
+            ("provider_code", "TEXT NOT NULL"),
+            ("display_name", "TEXT NOT NULL DEFAULT ''"),
+            ("account_ref", "TEXT"),
+            ("base_url", "TEXT"),
+            ("enabled", "INTEGER NOT NULL DEFAULT 1"),
+            ("config_json", "TEXT NOT NULL DEFAULT '{}'"),
+            ("created_at", "TEXT NOT NULL DEFAULT ''"),
+            ("updated_at", "TEXT NOT NULL DEFAULT ''"),
+        ],
     )?;
 
-    ensure_column(conn, "style_guides", "project_id", "TEXT NOT NULL")?;
-    ensure_column(conn, "style_guides", "name", "TEXT NOT NULL")?;
-    ensure_column(
+    ensure_columns(
         conn,
         "style_guides",
-        "instructions",
-        "TEXT NOT NULL DEFAULT ''",
+        &[
+            ("project_id", "TEXT NOT NULL"),
+            ("name", "TEXT NOT NULL"),
+            ("instructions", "TEXT NOT NULL DEFAULT ''"),
+            ("notes", "TEXT"),
+            ("created_at", "TEXT NOT NULL DEFAULT ''"),
+            ("updated_at", "TEXT NOT NULL DEFAULT ''"),
+        ],
     )?;
-    ensure_column(conn, "style_guides", "notes", "TEXT")?;
-    ensure_column(
-        conn,
-        "style_guides",
-        "created_at",
-        "TEXT NOT NULL DEFAULT ''",
-    )?;
-    ensure_column(
+
+    ensure_columns(
         conn,
-        "style_guides",
-        "updated_at",
-        "TEXT NOT NULL DEFAULT ''",
+        "characters",
+        &[
+            ("project_id", "TEXT NOT NULL"),
+            ("name", "TEXT NOT NULL"),
+            ("description", "TEXT"),
+            ("prompt_text", "TEXT"),
+            ("created_at", "TEXT NOT NULL DEFAULT ''"),
+            ("updated_at", "TEXT NOT NULL DEFAULT ''"),
+        ],
     )?;
 
-    ensure_column(conn, "characters", "project_id", "TEXT NOT NULL")?;
-    ensure_column(conn, "characters", "name", "TEXT NOT NULL")?;
-    ensure_column(conn, "characters", "description", "TEXT")?;
-    ensure_column(conn, "characters", "prompt_text", "TEXT")?;
-    ensure_column(conn, "characters", "created_at", "TEXT NOT NULL DEFAULT ''")?;
-    ensure_column(conn, "characters", "updated_at", "TEXT NOT NULL DEFAULT ''")?;
-
     Ok(())
 }
 
@@ -4,7 +4,7 @@ use serde_json::Value;
 use uuid::Uuid;
 
 use super::{
-    ensure_column, fetch_project_by_slug, is_unique_constraint_error,
+    ensure_columns, fetch_project_by_slug, is_unique_constraint_error,
     normalize_optional_storage_field, normalize_required_text, normalize_slug, now_iso,
     parse_json_value, ProjectsRepoError, ProjectsStore,
 };
@@ -87,7 +87,7 @@ impl ProjectsStore {
             let project = fetch_project_by_slug(conn, safe_slug.as_str())?
                 .ok_or(ProjectsRepoError::NotFound)?;
 
-            let mut stmt = conn.prepare(
+            let mut stmt = conn.prepare_cached(
                 "
                 SELECT id, project_id, name, description, created_at, updated_at
                 FROM reference_sets
@@ -249,7 +249,7 @@ impl ProjectsStore {
                 return Err(ProjectsRepoError::NotFound);
             }
 
-            let mut stmt = conn.prepare(
+            let mut stmt = conn.prepare_cached(
                 "
                 SELECT
                   id,
@@ -507,60 +507,32 @@ pub(super) fn ensure_reference_set_tables(conn: &Connection) -> Result<(), Proje
 }
 
 pub(super) fn ensure_reference_set_columns(conn: &Connection) -> Result<(), ProjectsRepoError> {
-    ensure_column(conn, "reference_sets", "project_id", "TEXT NOT NULL")?;
-    ensure_column(conn, "reference_sets", "name", "TEXT NOT NULL")?;
-    ensure_column(conn, "reference_sets", "description", "TEXT")?;
-    ensure_column(
+    ensure_columns(
         conn,
         "reference_sets",
-        "created_at",
-        "TEXT NOT NULL DEFAULT ''",
-    )?;
-    ensure_column(
-        conn,
-        "reference_sets",
-        "updated_at",
-        "TEXT NOT NULL DEFAULT ''",
+        &[
+            ("project_id", "TEXT NOT NULL"),
+            ("name", "TEXT NOT NULL"),
+            ("description", "TEXT"),
+            ("created_at", "TEXT NOT NULL DEFAULT ''"),
+            ("updated_at", "TEXT NOT NULL DEFAULT ''"),
+        ],
     )?;
 
-    ensure_column(conn, "reference_set_items", "project_id", "TEXT NOT NULL")?;
-    ensure_column(
-        conn,
-        "reference_set_items",
-        "reference_set_id",
-        "TEXT NOT NULL",
-    )?;
-    ensure_column(
-        conn,
-        "reference_set_items",
-        "label",
-        "TEXT NOT NULL DEFAULT ''",
-    )?;
-    ensure_column(conn, "reference_set_items", "content_uri", "TEXT")?;
-    ensure_column(conn, "reference_set_items", "content_text", "TEXT")?;
-    ensure_column(
-        conn,
-        "reference_set_items",
-        "sort_order",
-        "INTEGER NOT NULL DEFAULT 0",
-    )?;
-    ensure_column(
-        conn,
-        "reference_set_items",
-        "metadata_json",
-        "TEXT NOT NULL DEFAULT '{}'",
-    )?;
-    ensure_column(
-        conn,
-        "reference_set_items",
-        "created_at",
-        "TEXT NOT NULL DEFAULT ''",
-    )?;
-    ensure_column(
+    ensure_columns(
         conn,
         "reference_set_items",
-        "updated_at",
-        "TEXT NOT NULL DEFAULT ''",
+        &[
+            ("project_id", "TEXT NOT NULL"),
+            ("reference_set_id", "TEXT NOT NULL"),
+            ("label", "TEXT NOT NULL DEFAULT ''"),
+            ("content_uri", "TEXT"),
+            ("content_text", "TEXT"),
+            ("sort_order", "INTEGER NOT NULL DEFAULT 0"),
+            ("metadata_json", "TEXT NOT NULL DEFAULT '{}'"),
+            ("created_at", "TEXT NOT NULL DEFAULT ''"),
+            ("updated_at", "TEXT NOT NULL DEFAULT ''"),
+        ],
     )?;
 
     Ok(())
@@ -88,7 +88,7 @@ impl ProjectsStore {
             let project = fetch_project_by_slug(conn, safe_slug.as_str())?
                 .ok_or(ProjectsRepoError::NotFound)?;
             let capped = limit.clamp(1, 1000);
-            let mut stmt = conn.prepare(
+            let mut stmt = conn.prepare_cached(
                 "
                 SELECT *
                 FROM runs
@@ -172,7 +172,7 @@ impl ProjectsStore {
                 .ok_or(ProjectsRepoError::NotFound)?;
             let capped = limit.clamp(1, 2000);
 
-            let mut stmt = conn.prepare(
+            let mut stmt = conn.prepare_cached(
                 "
                 SELECT *
                 FROM assets
@@ -242,38 +242,25 @@ fn row_to_run_summary(row: &rusqlite::Row<'_>) -> rusqlite::Result<RunSummary> {
 }
 
 fn row_to_run_candidate_summary(row: &rusqlite::Row<'_>) -> rusqlite::Result<RunCandidateSummary> {
+    // The caller selects id, job_id, candidate_index, status,
+    // output_asset_id, final_asset_id, output_path, final_output_path,
+    // rank_hard_failures, rank_soft_warnings, rank_avg_chroma_exceed,
+    // meta_json, created_at; positional access skips the per-field name
+    // lookup on what can be thousands of rows per run.
     Ok(RunCandidateSummary {
-        id: row.get("id")?,
-        job_id: row.get("job_id")?,
-        candidate_index: row
-            .get::<_, Option<i64>>("candidate_index")?
-            .unwrap_or_default(),
-        status: row.get::<_, Option<String>>("status")?.unwrap_or_default(),
-        output_asset_id: row
-            .get::<_, Option<String>>("output_asset_id")?
-            .unwrap_or_default(),
-        final_asset_id: row
-            .get::<_, Option<String>>("final_asset_id")?
-            .unwrap_or_default(),
-        output_path: row
-            .get::<_, Option<String>>("output_path")?
-            .unwrap_or_default(),
-        final_output_path: row
-            .get::<_, Option<String>>("final_output_path")?
-            .unwrap_or_default(),
-        rank_hard_failures: row
-            .get::<_, Option<i64>>("rank_hard_failures")?
-            .unwrap_or_default(),
-        rank_soft_warnings: row
-            .get::<_, Option<i64>>("rank_soft_warnings")?
-            .unwrap_or_default(),
-        rank_avg_chroma_exceed: row
-            .get::<_, Option<f64>>("rank_avg_chroma_exceed")?
-            .unwrap_or(0.0),
-        meta_json: parse_json_value(row.get::<_, Option<String>>("meta_json")?),
-        created_at: row
-            .get::<_, Option<String>>("created_at")?
-            .unwrap_or_default(),
+        id: row.get(0)?,
+        job_id: row.get(1)?,
+        candidate_index: row.get::<_, Option<i64>>(2)?.unwrap_or_default(),
+        status: row.get::<_, Option<String>>(3)?.unwrap_or_default(),
+        output_asset_id: row.get::<_, Option<String>>(4)?.unwrap_or_default(),
+        final_asset_id: row.get::<_, Option<String>>(5)?.unwrap_or_default(),
+        output_path: row.get::<_, Option<String>>(6)?.unwrap_or_default(),
+        final_output_path: row.get::<_, Option<String>>(7)?.unwrap_or_default(),
+        rank_hard_failures: row.get::<_, Option<i64>>(8)?.unwrap_or_default(),
+        rank_soft_warnings: row.get::<_, Option<i64>>(9)?.unwrap_or_default(),
+        rank_avg_chroma_exceed: row.get::<_, Option<f64>>(10)?.unwrap_or(0.0),
+        meta_json: parse_json_value(row.get::<_, Option<String>>(11)?),
+        created_at: row.get::<_, Option<String>>(12)?.unwrap_or_default(),
     })
 }
 
@@ -323,7 +310,7 @@ fn fetch_jobs_with_candidates(
 ) -> Result<Vec<RunJobSummary>, ProjectsRepoError> {
     let mut candidates_by_job: HashMap<String, Vec<RunCandidateSummary>> = HashMap::new();
 
-    let mut candidate_stmt = conn.prepare(
+    let mut candidate_stmt = conn.prepare_cached(
         "
         SELECT
           id,
@@ -355,7 +342,7 @@ fn fetch_jobs_with_candidates(
             .push(candidate);
     }
 
-    let mut stmt = conn.prepare(
+    let mut stmt = conn.prepare_cached(
         "
         SELECT
           id,
@@ -378,31 +365,26 @@ fn fetch_jobs_with_candidates(
     let mut rows = stmt.query([run_id])?;
     let mut out = Vec::new();
 
+    // Column order matches the SELECT above: id, run_id, job_key, status,
+    // prompt_text, selected_candidate_index, selected_candidate,
+    // final_asset_id, final_output, meta_json, created_at.
     while let Some(row) = rows.next()? {
-        let job_id: String = row.get("id")?;
+        let job_id: String = row.get(0)?;
         let selected_candidate_index = row
-            .get::<_, Option<i64>>("selected_candidate_index")?
-            .or(row.get::<_, Option<i64>>("selected_candidate")?);
+            .get::<_, Option<i64>>(5)?
+            .or(row.get::<_, Option<i64>>(6)?);
 
         out.push(RunJobSummary {
             id: job_id.clone(),
-            run_id: row.get("run_id")?,
-            job_key: row.get::<_, Option<String>>("job_key")?.unwrap_or_default(),
-            status: row.get::<_, Option<String>>("status")?.unwrap_or_default(),
-            prompt_text: row
-                .get::<_, Option<String>>("prompt_text")?
-                .unwrap_or_default(),
+            run_id: row.get(1)?,
+            job_key: row.get::<_, Option<String>>(2)?.unwrap_or_default(),
+            status: row.get::<_, Option<String>>(3)?.unwrap_or_default(),
+            prompt_text: row.get::<_, Option<String>>(4)?.unwrap_or_default(),
             selected_candidate_index,
-            final_asset_id: row
-                .get::<_, Option<String>>("final_asset_id")?
-                .unwrap_or_default(),
-            final_output: row
-                .get::<_, Option<String>>("final_output")?
-                .unwrap_or_default(),
-            meta_json: parse_json_value(row.get::<_, Option<String>>("meta_json")?),
-            created_at: row
-                .get::<_, Option<String>>("created_at")?
-                .unwrap_or_default(),
+            final_asset_id: row.get::<_, Option<String>>(7)?.unwrap_or_default(),
+            final_output: row.get::<_, Option<String>>(8)?.unwrap_or_default(),
+            meta_json: parse_json_value(row.get::<_, Option<String>>(9)?),
+            created_at: row.get::<_, Option<String>>(10)?.unwrap_or_default(),
             candidates: candidates_by_job
                 .remove(job_id.as_str())
                 .unwrap_or_default(),
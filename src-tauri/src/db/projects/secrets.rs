@@ -12,7 +12,7 @@ use rusqlite::{params, Connection, OptionalExtension};
 use serde::{Deserialize, Serialize};
 
 use super::{
-    ensure_column, fetch_project_by_slug, normalize_optional_text, normalize_provider_code,
+    ensure_columns, fetch_project_by_slug, normalize_optional_text, normalize_provider_code,
     normalize_required_text, normalize_slug, now_iso, ProjectsRepoError, ProjectsStore,
 };
 
@@ -125,7 +125,7 @@ impl ProjectsStore {
             let project = fetch_project_by_slug(conn, safe_slug.as_str())?
                 .ok_or(ProjectsRepoError::NotFound)?;
 
-            let mut stmt = conn.prepare(
+            let mut stmt = conn.prepare_cached(
                 "
                 SELECT project_id, provider_code, secret_name, secret_value, updated_at
                 FROM project_secrets
@@ -151,7 +151,7 @@ impl ProjectsStore {
             let project = fetch_project_by_slug(conn, safe_slug.as_str())?
                 .ok_or(ProjectsRepoError::NotFound)?;
 
-            let mut stmt = conn.prepare(
+            let mut stmt = conn.prepare_cached(
                 "
                 SELECT secret_value, key_ref
                 FROM project_secrets
@@ -416,32 +416,18 @@ pub(super) fn ensure_secret_tables(conn: &Connection) -> Result<(), ProjectsRepo
 }
 
 pub(super) fn ensure_secret_columns(conn: &Connection) -> Result<(), ProjectsRepoError> {
-    ensure_column(conn, "project_secrets", "project_id", "TEXT NOT NULL")?;
-    ensure_column(conn, "project_secrets", "provider_code", "TEXT NOT NULL")?;
-    ensure_column(conn, "project_secrets", "secret_name", "TEXT NOT NULL")?;
-    ensure_column(
+    ensure_columns(
         conn,
         "project_secrets",
-        "secret_value",
-        "TEXT NOT NULL DEFAULT ''",
-    )?;
-    ensure_column(
-        conn,
-        "project_secrets",
-        "key_ref",
-        "TEXT NOT NULL DEFAULT 'local-master'",
-    )?;
-    ensure_column(
-        conn,
-        "project_secrets",
-        "created_at",
-        "TEXT NOT NULL DEFAULT ''",
-    )?;
-    ensure_column(
-        conn,
-        "project_secrets",
-        "updated_at",
-        "TEXT NOT NULL DEFAULT ''",
+        &[
+            ("project_id", "TEXT NOT NULL"),
+            ("provider_code", "TEXT NOT NULL"),
+            ("secret_name", "TEXT NOT NULL"),
+            ("secret_value", "TEXT NOT NULL DEFAULT ''"),
+            ("key_ref", "TEXT NOT NULL DEFAULT 'local-master'"),
+            ("created_at", "TEXT NOT NULL DEFAULT ''"),
+            ("updated_at", "TEXT NOT NULL DEFAULT ''"),
+        ],
     )?;
 
     Ok(())
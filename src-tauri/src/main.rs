@@ -23,62 +23,28 @@ async fn main() -> Result<(), Box<dyn std::error::Error>> {
     init_tracing();
 
     let cli_args = std::env::args().skip(1).collect::<Vec<_>>();
-    if matches!(
-        cli_args.first().map(String::as_str),
-        Some("validate-pipeline-config")
-    ) {
-        run_validate_pipeline_config_cli(cli_args.into_iter().skip(1).collect::<Vec<_>>())?;
-        return Ok(());
-    }
-    if matches!(
-        cli_args.first().map(String::as_str),
-        Some("secrets-rotation-status")
-    ) {
-        run_secrets_rotation_status_cli(cli_args.into_iter().skip(1).collect::<Vec<_>>())?;
-        return Ok(());
-    }
-    if matches!(cli_args.first().map(String::as_str), Some("secrets-rotate")) {
-        run_secrets_rotate_cli(cli_args.into_iter().skip(1).collect::<Vec<_>>())?;
-        return Ok(());
-    }
-    if matches!(cli_args.first().map(String::as_str), Some("agent-worker")) {
-        run_agent_worker_cli(cli_args.into_iter().skip(1).collect::<Vec<_>>())?;
-        return Ok(());
-    }
-    if matches!(cli_args.first().map(String::as_str), Some("generate-one")) {
-        run_generate_one_cli(cli_args.into_iter().skip(1).collect::<Vec<_>>())?;
-        return Ok(());
-    }
-    if matches!(cli_args.first().map(String::as_str), Some("upscale")) {
-        run_upscale_cli(cli_args.into_iter().skip(1).collect::<Vec<_>>())?;
-        return Ok(());
-    }
-    if matches!(cli_args.first().map(String::as_str), Some("color")) {
-        run_color_cli(cli_args.into_iter().skip(1).collect::<Vec<_>>())?;
-        return Ok(());
-    }
-    if matches!(cli_args.first().map(String::as_str), Some("bgremove")) {
-        run_bgremove_cli(cli_args.into_iter().skip(1).collect::<Vec<_>>())?;
-        return Ok(());
-    }
-    if matches!(cli_args.first().map(String::as_str), Some("qa")) {
-        run_qa_cli(cli_args.into_iter().skip(1).collect::<Vec<_>>())?;
-        return Ok(());
-    }
-    if matches!(cli_args.first().map(String::as_str), Some("archive-bad")) {
-        run_archive_bad_cli(cli_args.into_iter().skip(1).collect::<Vec<_>>())?;
-        return Ok(());
-    }
-    if matches!(cli_args.first().map(String::as_str), Some("db:init")) {
-        run_db_init_cli(cli_args.into_iter().skip(1).collect::<Vec<_>>())?;
-        return Ok(());
-    }
-    if matches!(cli_args.first().map(String::as_str), Some("db:ensure-user")) {
-        run_db_ensure_user_cli(cli_args.into_iter().skip(1).collect::<Vec<_>>())?;
-        return Ok(());
-    }
-    if matches!(cli_args.first().map(String::as_str), Some("tools:install")) {
-        run_tools_install_cli(cli_args.into_iter().skip(1).collect::<Vec<_>>())?;
+    // Resolve the subcommand once instead of re-probing the first
+    // argument per command; unknown or absent subcommands fall through
+    // to the server, matching the old behavior.
+    type CliRunner = fn(Vec<String>) -> Result<(), Box<dyn std::error::Error>>;
+    let runner: Option<CliRunner> = match cli_args.first().map(String::as_str) {
+        Some("validate-pipeline-config") => Some(run_validate_pipeline_config_cli),
+        Some("secrets-rotation-status") => Some(run_secrets_rotation_status_cli),
+        Some("secrets-rotate") => Some(run_secrets_rotate_cli),
+        Some("agent-worker") => Some(run_agent_worker_cli),
+        Some("generate-one") => Some(run_generate_one_cli),
+        Some("upscale") => Some(run_upscale_cli),
+        Some("color") => Some(run_color_cli),
+        Some("bgremove") => Some(run_bgremove_cli),
+        Some("qa") => Some(run_qa_cli),
+        Some("archive-bad") => Some(run_archive_bad_cli),
+        Some("db:init") => Some(run_db_init_cli),
+        Some("db:ensure-user") => Some(run_db_ensure_user_cli),
+        Some("tools:install") => Some(run_tools_install_cli),
+        _ => None,
+    };
+    if let Some(run) = runner {
+        run(cli_args.into_iter().skip(1).collect::<Vec<_>>())?;
         return Ok(());
     }
 
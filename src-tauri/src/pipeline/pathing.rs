@@ -1,5 +1,27 @@
+use std::collections::HashMap;
 use std::fs;
 use std::path::{Component, Path, PathBuf};
+use std::sync::{LazyLock, Mutex};
+
+// The app root never moves while the process is running, so resolve it once
+// per distinct root instead of paying the component-by-component stat walk of
+// canonicalize on every request.
+static CANONICAL_ROOTS: LazyLock<Mutex<HashMap<PathBuf, PathBuf>>> =
+    LazyLock::new(|| Mutex::new(HashMap::new()));
+
+fn canonical_root_for(root: &Path) -> Result<PathBuf, String> {
+    let mut roots = CANONICAL_ROOTS
+        .lock()
+        .map_err(|e| format!("Canonical root cache lock poisoned: {e}"))?;
+    if let Some(hit) = roots.get(root) {
+        return Ok(hit.clone());
+    }
+    let canonical = root
+        .canonicalize()
+        .map_err(|e| format!("Failed to resolve app root: {e}"))?;
+    roots.insert(root.to_path_buf(), canonical.clone());
+    Ok(canonical)
+}
 
 pub fn resolve_under_root(root: &Path, value: &str) -> PathBuf {
     let path = PathBuf::from(value);
@@ -41,21 +63,23 @@ pub fn resolve_request_path_under_root(
     // Canonical path containment check to prevent symlink traversal
     // For existing paths: check the path itself
     // For non-existent paths: check the nearest existing ancestor
-    let canonical_root = root.canonicalize()
-        .map_err(|e| format!("Failed to resolve app root: {e}"))?;
-    
-    let check_path = if candidate.exists() {
-        candidate.canonicalize()
-            .map_err(|e| format!("Failed to resolve path: {e}"))?
-    } else {
-        // Find nearest existing ancestor
-        let mut ancestor = candidate.as_path();
-        while !ancestor.exists() {
-            ancestor = ancestor.parent()
-                .ok_or_else(|| format!("{field} has no valid ancestor within root"))?;
+    let canonical_root = canonical_root_for(root)?;
+
+    // Try the candidate directly instead of a separate exists() probe; a
+    // NotFound error is the same signal with one fewer stat.
+    let check_path = match candidate.canonicalize() {
+        Ok(path) => path,
+        Err(error) if error.kind() == std::io::ErrorKind::NotFound => {
+            // Find nearest existing ancestor
+            let mut ancestor = candidate.as_path();
+            while !ancestor.exists() {
+                ancestor = ancestor.parent()
+                    .ok_or_else(|| format!("{field} has no valid ancestor within root"))?;
+            }
+            ancestor.canonicalize()
+                .map_err(|e| format!("Failed to resolve ancestor path: {e}"))?
         }
-        ancestor.canonicalize()
-            .map_err(|e| format!("Failed to resolve ancestor path: {e}"))?
+        Err(error) => return Err(format!("Failed to resolve path: {error}")),
     };
     
     if !check_path.starts_with(&canonical_root) {
@@ -68,6 +68,10 @@ pub fn run_agent_worker_loop(
     store: &ProjectsStore,
     options: &AgentWorkerOptions,
 ) -> Result<AgentWorkerRunSummary, AgentWorkerError> {
+    // One client for the whole loop: rebuilding it per instruction threw
+    // away the connection pool, so every dispatch paid a fresh TCP (and
+    // TLS) handshake against the same agent endpoint.
+    let client = build_dispatch_client(options)?;
     let mut processed = 0usize;
     loop {
         let lease = store.reserve_next_agent_instruction(
@@ -85,7 +89,7 @@ pub fn run_agent_worker_loop(
             continue;
         };
 
-        process_one_instruction(store, options, &lease)?;
+        process_one_instruction(store, options, &client, &lease)?;
         processed += 1;
         if options.once {
             break;
@@ -102,6 +106,7 @@ pub fn run_agent_worker_loop(
 fn process_one_instruction(
     store: &ProjectsStore,
     options: &AgentWorkerOptions,
+    client: &Client,
     lease: &AgentInstructionWorkerLease,
 ) -> Result<(), AgentWorkerError> {
     let attempts = lease.attempts + 1;
@@ -109,10 +114,11 @@ fn process_one_instruction(
     let (target_url, target_token) = resolve_agent_target(store, options, lease)?;
     let dispatch = dispatch_instruction_http(
         options,
+        client,
         lease,
         target_url.as_deref(),
         target_token.as_deref(),
-    )?;
+    );
 
     if dispatch.ok {
         let remote_status = map_remote_status(
@@ -207,20 +213,30 @@ struct DispatchResult {
     error: Option<String>,
 }
 
+fn build_dispatch_client(options: &AgentWorkerOptions) -> Result<Client, AgentWorkerError> {
+    Client::builder()
+        .timeout(Duration::from_secs_f64(
+            options.dispatch_timeout_seconds.max(0.1),
+        ))
+        .build()
+        .map_err(|error| AgentWorkerError::DispatchBuild(error.to_string()))
+}
+
 fn dispatch_instruction_http(
     options: &AgentWorkerOptions,
+    client: &Client,
     lease: &AgentInstructionWorkerLease,
     target_url: Option<&str>,
     token: Option<&str>,
-) -> Result<DispatchResult, AgentWorkerError> {
+) -> DispatchResult {
     let target_url = target_url.map(str::trim).unwrap_or_default();
     if target_url.is_empty() {
-        return Ok(DispatchResult {
+        return DispatchResult {
             ok: false,
             http_status: None,
             response: None,
             error: Some(String::from("missing_agent_api_url")),
-        });
+        };
     }
 
     let payload = json!({
@@ -233,13 +249,6 @@ fn dispatch_instruction_http(
         }
     });
 
-    let client = Client::builder()
-        .timeout(Duration::from_secs_f64(
-            options.dispatch_timeout_seconds.max(0.1),
-        ))
-        .build()
-        .map_err(|error| AgentWorkerError::DispatchBuild(error.to_string()))?;
-
     let mut attempt = 0i64;
     let max_attempts = options.dispatch_retries.max(0) + 1;
     let mut last_error = String::from("dispatch_failed");
@@ -260,12 +269,12 @@ fn dispatch_instruction_http(
                 if (200..300).contains(&status) {
                     let parsed = serde_json::from_str::<Value>(body_text.as_str())
                         .unwrap_or_else(|_| json!({}));
-                    return Ok(DispatchResult {
+                    return DispatchResult {
                         ok: true,
                         http_status: Some(status),
                         response: Some(parsed),
                         error: None,
-                    });
+                    };
                 }
                 last_error = format!("http_{status}:{body_text}");
             }
@@ -281,12 +290,12 @@ fn dispatch_instruction_http(
         }
     }
 
-    Ok(DispatchResult {
+    DispatchResult {
         ok: false,
         http_status: None,
         response: None,
         error: Some(last_error),
-    })
+    }
 }
 
 #[cfg(test)]